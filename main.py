@@ -1,6 +1,7 @@
 import pygame
 import sys
 import os
+import time
 
 # Helper function to get correct resource path
 def resource_path(relative_path):
@@ -20,31 +21,86 @@ from src.constants import *
 from src.player.player import Player
 from src.world.camera import Camera
 from src.world.platform import Platform
+from src.world.spatial import SortedXIndex, UniformGrid
+from src.world.collision import sweep_aabb, landing_time
+from src.world.level_chunks import ChunkedLevelLayer
+from src.world.parallax import ParallaxBackground
 from src.enemies.enemy import Enemy
+from src.effects.particles import ParticleSystem, hit_sparks, landing_dust
 from src.ui.menu import Menu
 from src.ui.game_over_fixed import GameOver
 from src.ui.win_screen import WinScreen
+from src.assets.cache import asset_cache
+from src.assets.transforms import transform_cache
+from src.assets.bundle import open_bundle
+from src.assets.background import get_background, background_service
+from src.assets.loader import AssetLoader
+from src.assets.manifest import startup_images, BACKGROUND_IMAGE
+from src.ui.loading_screen import LoadingScreen
+from src.ui.text_cache import text_cache
+from src.render.dirty_rects import DirtyRectRenderer
+from src.render.batch import SpriteBatch
+from src.debug.frame_budget import FrameAllocationBudget, FrameBudgetExceeded
+from src.input.replay import InputRecorder
 
 class Game:
     def __init__(self):
         print("Initializing game...")
+        # Отсчет времени до первого кадра
+        self.start_time = time.perf_counter()
+        self.first_frame_time = None
+        self.menu_frame_time = None
+        self.quit_requested = False
+        # Меню создается после загрузки ресурсов
+        self.menu = None
+        
         pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Platform Adventure")
         self.clock = pygame.time.Clock()
+        self.renderer = DirtyRectRenderer(self.screen, enabled=DIRTY_RECTS)
+        self.sprite_batch = SpriteBatch()
+        self.visible_enemies = []
+        self.nearby_platforms = []
+        # Зажатые клавиши по событиям KEYDOWN/KEYUP (get_pressed создает новый массив каждый кадр)
+        self.held_keys = set()
+        # Нажатия с прошлого тика: прыжок и атака выполняются в update, поэтому
+        # ввод тика целиком задается парой (held_keys, pressed_keys)
+        self.pressed_keys = set()
+        self.recorder = InputRecorder(REPLAY_RECORD) if REPLAY_RECORD else None
+        self.world_layer = None
+        self.world_layer_key = None
+        # Номер сгенерированного уровня, увеличивается при каждом пересоздании
+        self.level_generation = 0
+        self.level_layer = ChunkedLevelLayer()
+        self.last_camera_x = None
         self.game_state = MENU
         print(f"Initial game state: {self.game_state}")
         
+        # Предсобранный бандл (tools/build_bundle.py) избавляет от декодирования JPEG/PNG
+        bundle = open_bundle()
+        if bundle is not None:
+            asset_cache.attach_bundle(bundle)
+            print(f"Подключен бандл ресурсов: {bundle.path} ({len(bundle)} изображений)")
+        
+        # Декодируем ресурсы в фоне, пока показываем экран загрузки
+        self.loading_screen = LoadingScreen()
+        self.load_assets()
+        
         # Load background and textures
         print("Загрузка фона...")
         try:
-            self.background = pygame.image.load(resource_path(os.path.join('images', 'backgrownd.jpg')))
-            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+            self.background = get_background((WIDTH, HEIGHT))
         except Exception as e:
             print(f"Ошибка при загрузке фона: {e}")
             self.background = pygame.Surface((WIDTH, HEIGHT))
             self.background.fill((50, 50, 50))  # Тёмно-серый фон по умолчанию
         
+        # Фон в игре рисуется слоями параллакса
+        self.parallax = ParallaxBackground()
+        for factor, y in PARALLAX_LAYERS:
+            self.parallax.add_layer(self.background, factor, y)
+        
         # Загрузка текстур платформ с обработкой ошибок
         print("Загрузка текстур платформ...")
         try:
@@ -56,10 +112,11 @@ class Game:
             self.platform_textures = []
             for filename in platform_files:
                 try:
-                    img_path = resource_path(os.path.join('images', 'city', filename))
+                    img_path = os.path.join('images', 'city', filename)
                     print(f"Пытаемся загрузить: {img_path}")
-                    if os.path.exists(img_path): # This check might be less reliable with _MEIPASS
-                        texture = pygame.image.load(img_path)
+                    if asset_cache.has(img_path):  # Файл на диске или запись в бандле
+                        # Исходный размер: платформы собираются из текстуры без растягивания
+                        texture = asset_cache.get_image(img_path)
                         self.platform_textures.append(texture)
                         print(f"Успешно загружена текстура: {filename}")
                 except Exception as e:
@@ -68,9 +125,7 @@ class Game:
             if not self.platform_textures:
                 raise Exception("Не удалось загрузить ни одной текстуры платформы")
 
-            # Масштабируем загруженные текстуры
-            self.platform_textures = [pygame.transform.scale(tex, (PLATFORM_WIDTH, PLATFORM_HEIGHT)) for tex in self.platform_textures]
-            print(f"Текстуры успешно масштабированы, загружено {len(self.platform_textures)} текстур")
+            print(f"Текстуры платформ загружены: {len(self.platform_textures)} шт.")
 
         except Exception as e:
             print(f"Ошибка при загрузке/масштабировании текстур платформ: {e}")
@@ -92,10 +147,55 @@ class Game:
         self.game_over_screen = GameOver()
         self.win_screen = WinScreen()
         print("UI elements created")
+        # Все нужные размеры уже в кэше, исходники больше не нужны
+        asset_cache.release_originals()
+        background_service.release()
+        asset_cache.report()
+        
+    def load_assets(self):
+        """Фоновая загрузка стартовых ресурсов. Главный поток в это время
+        обрабатывает события и рисует экран загрузки; ниже по __init__
+        все изображения берутся из asset_cache без обращения к диску."""
+        loader = AssetLoader()
+        for path, size, alpha in startup_images():
+            if path == BACKGROUND_IMAGE:
+                # Фон собирается из мип-уровней сервисом фона
+                if not asset_cache.contains(path, size, alpha):
+                    loader.submit((path, size, alpha), background_service.prepare, size)
+            else:
+                loader.submit_image(path, size, alpha)
+        print(f"Фоновая загрузка: {loader.total} изображений")
+        
+        while not loader.done:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.quit_requested = True
+            loader.poll()
+            self.loading_screen.draw(self.screen, loader.progress)
+            pygame.display.flip()
+            self.mark_frame_presented()
+            self.clock.tick(FPS)
+        loader.shutdown()
+        
+    def mark_frame_presented(self):
+        """Запоминаем и выводим время до первого кадра и до первого кадра меню"""
+        elapsed_ms = (time.perf_counter() - self.start_time) * 1000
+        if self.first_frame_time is None:
+            self.first_frame_time = elapsed_ms
+            print(f"Time to first frame: {elapsed_ms:.1f} ms")
+        if self.menu_frame_time is None and self.menu is not None and self.game_state == MENU:
+            self.menu_frame_time = elapsed_ms
+            print(f"Time to menu: {elapsed_ms:.1f} ms")
         
     def init_game_objects(self):
         self.player = Player(50, HEIGHT - 100)
+        self.animations_ready = False
         self.camera = Camera(WIDTH, HEIGHT)
+        # Искры от ударов и пыль при приземлении
+        self.effects = ParticleSystem(capacity=PARTICLE_CAPACITY, gravity=PARTICLE_GRAVITY)
+        # Уровень пересоздан: статичный слой мира нужно собрать заново
+        self.level_generation += 1
+        self.last_camera_x = None
         
         # Platform configurations
         platform_configs = [
@@ -138,6 +238,15 @@ class Game:
             Enemy(2800, HEIGHT - 290),
         ]
         
+        # Индексы по X для отсечения всего, что вне камеры
+        self.platform_index = SortedXIndex(self.platforms, Platform.bounds)
+        self.enemy_index = SortedXIndex(self.enemies, Enemy.patrol_bounds)
+        # Сетка платформ: столкновения проверяются только с платформами рядом с игроком
+        self.platform_grid = UniformGrid(self.platforms, Platform.rect, PLATFORM_GRID_CELL)
+        
+        # Платформы неподвижны: они рисуются в чанки один раз
+        self.level_layer.set_level(self.platform_index, self.platforms)
+        
     def reset_game(self):
         self.game_state = PLAYING
         self.init_game_objects()
@@ -147,6 +256,14 @@ class Game:
             if event.type == pygame.QUIT:
                 return False
             
+            if event.type == pygame.KEYDOWN:
+                self.held_keys.add(event.key)
+                self.pressed_keys.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held_keys.discard(event.key)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.held_keys.clear()
+            
             if event.type == pygame.MOUSEBUTTONDOWN:
                 print(f"Mouse click at {event.pos}")
                 if self.game_state == MENU and self.menu.handle_click(event.pos):
@@ -167,76 +284,115 @@ class Game:
                 self.game_over_screen.retry_button.update(mouse_pos)
             elif self.game_state == WIN:
                 self.win_screen.retry_button.update(mouse_pos)
-            
-            if event.type == pygame.KEYDOWN and self.game_state == PLAYING:
-                if event.key == pygame.K_SPACE and not self.player.jumping:
-                    print("Player jumping")
-                    self.player.vel_y = self.player.jump_power
-                    self.player.jumping = True
-                    self.player.on_ground = False
-                # Добавляем обработку атаки по кнопке Q
-                elif event.key == pygame.K_q:
-                    print("Player attacking")
-                    self.player.start_attack()
-                    
-                    # Проверяем, находятся ли враги в зоне поражения
-                    for enemy in self.enemies:
-                        if enemy.alive:
-                            # Определяем область атаки в зависимости от направления игрока
-                            attack_x_min = self.player.x - ATTACK_RANGE if not self.player.facing_right else self.player.x
-                            attack_x_max = self.player.x if not self.player.facing_right else self.player.x + self.player.width + ATTACK_RANGE
-                            
-                            # Проверяем, находится ли враг в зоне атаки
-                            if (enemy.x + enemy.width > attack_x_min and 
-                                enemy.x < attack_x_max and
-                                abs(enemy.y - self.player.y) < PLAYER_HEIGHT):
-                                print(f"Enemy hit by attack at {enemy.x},{enemy.y}")
-                                enemy.alive = False
-                                self.player.score += 100
         
         return True
 
+    def apply_input(self, held, pressed):
+        """Ввод следующего тика без событий pygame: зажатые и нажатые с
+        прошлого тика клавиши (сценарии и повтор записей)"""
+        self.held_keys.clear()
+        self.held_keys.update(held)
+        self.pressed_keys.update(pressed)
+
+    def handle_key_presses(self):
+        """Прыжок и атака по нажатиям, накопленным с прошлого тика"""
+        for key in self.pressed_keys:
+            if key == pygame.K_SPACE and not self.player.jumping:
+                print("Player jumping")
+                self.player.vel_y = self.player.jump_power
+                self.player.jumping = True
+                self.player.on_ground = False
+            # Добавляем обработку атаки по кнопке Q
+            elif key == pygame.K_q:
+                print("Player attacking")
+                self.player.start_attack()
+                
+                # Проверяем, находятся ли враги в зоне поражения
+                for enemy in self.enemies:
+                    if enemy.alive:
+                        # Определяем область атаки в зависимости от направления игрока
+                        attack_x_min = self.player.x - ATTACK_RANGE if not self.player.facing_right else self.player.x
+                        attack_x_max = self.player.x if not self.player.facing_right else self.player.x + self.player.width + ATTACK_RANGE
+                        
+                        # Проверяем, находится ли враг в зоне атаки
+                        if (enemy.x + enemy.width > attack_x_min and 
+                            enemy.x < attack_x_max and
+                            abs(enemy.y - self.player.y) < PLAYER_HEIGHT):
+                            print(f"Enemy hit by attack at {enemy.x},{enemy.y}")
+                            enemy.alive = False
+                            hit_sparks(self.effects, enemy.x + enemy.width / 2, enemy.y + enemy.height / 2)
+                            self.player.score += 100
+
     def update(self):
+        if self.game_state == MENU and not self.animations_ready:
+            # Пока открыто меню, подгружаем отложенные анимации игрока по одной за кадр
+            self.animations_ready = self.player.warm_up_animations(limit=1)
+        
         if self.game_state == PLAYING:
+            if self.recorder:
+                self.recorder.record(self.held_keys, self.pressed_keys)
+            self.handle_key_presses()
+            
             # Handle player movement
-            keys = pygame.key.get_pressed()
+            keys = self.held_keys
             self.player.vel_x = 0
-            if keys[pygame.K_LEFT]:
+            if pygame.K_LEFT in keys:
                 self.player.vel_x = -self.player.speed
                 self.player.facing_right = False
-            if keys[pygame.K_RIGHT]:
+            if pygame.K_RIGHT in keys:
                 self.player.vel_x = self.player.speed
                 self.player.facing_right = True
 
             # Update game objects
             self.player.move()
             
-            # Platform collision
-            self.player.on_ground = False
-            for platform in self.platforms:
-                if (self.player.y + self.player.height >= platform.y and 
-                    self.player.y < platform.y and 
-                    self.player.x + self.player.width > platform.x and 
-                    self.player.x < platform.x + platform.width):
-                    if self.player.vel_y >= 0:
-                        self.player.y = platform.y - self.player.height
-                        self.player.vel_y = 0
-                        self.player.on_ground = True
-                        self.player.jumping = False
+            # Platform collision: путь игрока за тик проверяется целиком (swept AABB),
+            # чтобы при большой скорости или крупном шаге не пролететь сквозь платформу
+            player = self.player
+            was_on_ground = player.on_ground
+            player.on_ground = False
+            left = min(player.prev_x, player.x)
+            top = min(player.prev_y, player.y)
+            nearby = self.platform_grid.query(left, top, abs(player.x - player.prev_x) + player.width,
+                                              abs(player.y - player.prev_y) + player.height,
+                                              self.nearby_platforms)
+            landed_on = None
+            first_contact = None
+            if player.vel_y >= 0:
+                for platform in nearby:
+                    contact = landing_time(player.prev_x, player.prev_y, player.x, player.y,
+                                           player.width, player.height, platform)
+                    # Встаем на платформу, которой коснулись раньше (при равенстве - на последнюю)
+                    if contact is not None and (first_contact is None or contact <= first_contact):
+                        landed_on = platform
+                        first_contact = contact
+            if landed_on is not None:
+                if not was_on_ground and player.vel_y >= LANDING_DUST_MIN_SPEED:
+                    landing_dust(self.effects, player.x, landed_on.y, player.width)
+                player.y = landed_on.y - player.height
+                player.vel_y = 0
+                player.on_ground = True
+                player.jumping = False
 
-            # Update enemies and check collisions
+            # Update enemies and check collisions: путь игрока и врага за тик
+            # проверяется целиком (swept AABB), если их пути рядом по горизонтали
+            path = (player.prev_x, player.prev_y, player.width, player.height)
+            dx = player.x - player.prev_x
+            dy = player.y - player.prev_y
+            right = left + abs(dx) + player.width
             for enemy in self.enemies:
                 if enemy.alive:
                     enemy.move(self.player)
                     
-                    # Проверяем столкновение с игроком
-                    collision_x = (self.player.x + self.player.width > enemy.x and 
-                                 self.player.x < enemy.x + enemy.width)
-                    collision_y = (self.player.y + self.player.height > enemy.y and 
-                                 self.player.y < enemy.y + enemy.height)
+                    if enemy.x >= right and enemy.prev_x >= right:
+                        continue
+                    if enemy.x + enemy.width <= left and enemy.prev_x + enemy.width <= left:
+                        continue
+                    contact = sweep_aabb(path, dx, dy, (enemy.prev_x, enemy.y, enemy.width, enemy.height),
+                                         enemy.x - enemy.prev_x)
                     
                     # При любом касании врага игрок проигрывает
-                    if collision_x and collision_y:
+                    if contact is not None:
                         self.game_state = GAME_OVER
                         print("Game Over - столкновение с врагом!")
               # Проверка достижения конца уровня (правого края)
@@ -249,51 +405,166 @@ class Game:
                 self.game_state = GAME_OVER
                 print("Game Over - падение в пропасть!")
 
-            # Update camera
-            self.camera.update(self.player)
+            self.effects.update(SIM_STEP_SCALE)
+
+            if self.game_state != PLAYING:
+                self.finish_recording()
+
+        # Нажатия обработаны (вне игры они просто отбрасываются)
+        self.pressed_keys.clear()
+
+    def finish_recording(self):
+        """Сохраняет запись ввода (если она ведется) с текущим итогом"""
+        if self.recorder:
+            self.recorder.finish(self.game_state, self.player.score)
 
-    def draw(self):
-        self.screen.fill(BLACK)
+    def draw_world_static(self, surface):
+        """Неподвижная часть мира: фон и платформы"""
+        # Draw parallax background
+        self.parallax.draw(surface, self.camera.camera.x)
+        
+        # Платформы заранее отрисованы в чанки: не больше двух блитов за кадр
+        self.level_layer.draw(surface, self.camera.camera.x)
+    
+    def world_static_layer(self, camera_x):
+        """Фон и платформы при текущем положении камеры, собранные в
+        отдельную поверхность (пересобирается, только если камера сдвинулась)"""
+        if self.world_layer is None:
+            self.world_layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+        key = self.world_layer_key
+        if key is None or key[1] != camera_x or key[2] != self.level_generation:
+            self.world_layer.fill(BLACK)
+            self.draw_world_static(self.world_layer)
+            # Ключ создается только при пересборке и служит ключом слоя для рендерера
+            self.world_layer_key = (PLAYING, camera_x, self.level_generation)
+        return self.world_layer
 
+    def draw(self, alpha=1.0):
+        """Рисует кадр. alpha - доля тика симуляции, прошедшая после
+        последнего update(): объекты рисуются между прошлым и текущим тиком"""
         if self.game_state == MENU:
-            self.menu.draw(self.screen)
+            self.renderer.begin_frame(self.menu.static_layer(), key=MENU)
+            self.renderer.mark_all(self.menu.draw_dynamic(self.screen))
         elif self.game_state == PLAYING:
-            # Draw parallax background
-            rel_x = self.camera.camera.x % WIDTH
-            self.screen.blit(self.background, (-rel_x, 0))
-            if rel_x < WIDTH:
-                self.screen.blit(self.background, (WIDTH - rel_x, 0))
-            
-            # Draw game objects
-            for platform in self.platforms:
-                platform.draw(self.screen, self.camera)
-            
-            for enemy in self.enemies:
-                enemy.draw(self.screen, self.camera)
+            # Камера следует за интерполированным положением игрока
+            self.player.interpolate(alpha)
+            self.camera.follow(self.player.render_x)
+            camera_x = self.camera.camera.x
+            if self.renderer.enabled and camera_x == self.last_camera_x:
+                # Камера стоит: фон и платформы восстанавливаются из статичного слоя
+                layer = self.world_static_layer(camera_x)
+                self.renderer.begin_frame(layer, key=self.world_layer_key)
+            else:
+                # Камера движется: рисуем весь кадр
+                self.renderer.begin_frame()
+                self.screen.fill(BLACK)
+                self.draw_world_static(self.screen)
+            self.last_camera_x = camera_x
             
-            self.player.draw(self.screen, self.camera)
+            # Draw game objects (только враги, чья зона патрулирования видна).
+            # Спрайты собираются в пакет и выводятся одним screen.blits
+            # Пары спрайтов и список видимых врагов переиспользуются между кадрами
+            batch = self.sprite_batch
+            camera = self.camera
+            for enemy in self.enemy_index.query(camera_x, camera_x + camera.width, self.visible_enemies):
+                sprite = enemy.sprite(camera, alpha)
+                if sprite is not None:
+                    batch.add_item(sprite)
+            batch.add_all(self.player.sprites(camera))
+            batch.add_all(self.effects.sprites(-camera_x))
+            # Прямоугольники нужны только для вывода грязными областями
+            if self.renderer.enabled:
+                self.renderer.mark_sprites(batch.items)
+            batch.flush(self.screen)
         elif self.game_state == GAME_OVER:
-            self.game_over_screen.draw(self.screen, self.player.score)
+            score = self.player.score
+            self.renderer.begin_frame(self.game_over_screen.static_layer(score), key=(GAME_OVER, score))
+            self.renderer.mark_all(self.game_over_screen.draw_dynamic(self.screen))
         elif self.game_state == WIN:
-            self.win_screen.draw(self.screen, self.player.score)
+            score = self.player.score
+            self.renderer.begin_frame(self.win_screen.static_layer(score), key=(WIN, score))
+            self.renderer.mark_all(self.win_screen.draw_dynamic(self.screen))
         
-        pygame.display.flip()
+        self.renderer.present()
+        if self.menu_frame_time is None:
+            self.mark_frame_presented()
 
     def run(self):
         print("Starting game loop...")
-        running = True
+        running = not self.quit_requested
+        # В режиме тестирования проверяем выделения памяти за кадр игрового процесса
+        budget = None
+        if ALLOC_CHECK:
+            budget = FrameAllocationBudget(FRAME_ALLOC_BUDGET, ALLOC_CHECK_WARMUP_FRAMES, states=(PLAYING,))
+            budget.start()
+        # Симуляция идет фиксированными тиками, накопленное реальное время
+        # расходуется целыми тиками, остаток задает интерполяцию отрисовки
+        step = 1.0 / SIM_RATE
+        accumulator = 0.0
+        previous = time.perf_counter()
         try:
             while running:
+                now = time.perf_counter()
+                accumulator += min(now - previous, MAX_FRAME_TIME)
+                previous = now
                 running = self.handle_events()
-                self.update()
-                self.draw()
+                if budget:
+                    budget.begin_frame(self.game_state)
+                while accumulator >= step:
+                    self.update()
+                    accumulator -= step
+                self.draw(accumulator / step)
+                if budget:
+                    budget.end_frame(self.game_state)
                 self.clock.tick(FPS)
+        except FrameBudgetExceeded:
+            raise
         except Exception as e:
             print(f"Error in game loop: {e}")
         finally:
             print("Exiting game...")
+            self.finish_recording()
+            if budget:
+                budget.stop()
+                budget.report()
+            asset_cache.report()
+            transform_cache.report()
+            text_cache.report()
+            self.renderer.report()
             pygame.quit()
 
+    def run_headless(self, controller, max_ticks, restart=False):
+        """Симуляция без отрисовки и ограничения частоты: тики update идут
+        так быстро, как позволяет процессор, ввод берется из controller
+        (см. src/input/scripted.py). Окно не нужно - запускать с
+        SDL_VIDEODRIVER=dummy (tools/run_headless.py). При restart после
+        проигрыша или победы игра начинается заново, иначе прогон
+        заканчивается. Возвращает число выполненных тиков."""
+        print(f"Headless run: {max_ticks} ticks, input {type(controller).__name__}")
+        self.game_state = PLAYING
+        ticks = 0
+        runs = 0
+        start = time.perf_counter()
+        try:
+            while ticks < max_ticks:
+                held, pressed = controller.next_input(self)
+                self.apply_input(held, pressed)
+                self.update()
+                ticks += 1
+                if self.game_state != PLAYING:
+                    runs += 1
+                    if not restart:
+                        break
+                    self.reset_game()
+        finally:
+            self.finish_recording()
+            elapsed = time.perf_counter() - start
+            rate = ticks / elapsed if elapsed > 0 else 0.0
+            print(f"Headless: {ticks} ticks in {elapsed:.2f} s, {rate:.0f} ticks/s "
+                  f"({rate / SIM_RATE:.1f}x real time), finished runs: {runs}, "
+                  f"state {self.game_state}, score {self.player.score}")
+        return ticks
+
 if __name__ == '__main__':
     game = Game()
     game.run()
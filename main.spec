@@ -1,11 +1,17 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
 
+# Собираем бандл уже масштабированных изображений (tools/build_bundle.py).
+# В сборку попадает он и индекс атласа вместо всей папки images/.
+sys.path.insert(0, SPECPATH)
+from tools.build_bundle import build_bundle
+build_bundle()
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('images', 'images')],
+    datas=[('assets.bundle', '.'), ('images/atlas/player.json', 'images/atlas')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
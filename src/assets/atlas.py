@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.assets.cache import asset_cache, resource_path
+
+
+class Atlas:
+    """Атлас спрайтов: один или несколько листов и индекс прямоугольников кадров.
+
+    Кадры отдаются как subsurface листа, то есть без копирования пикселей.
+    Индекс создается утилитой tools/pack_atlas.py.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        with open(resource_path(index_path), encoding='utf-8') as f:
+            index = json.load(f)
+        self.frame_size = tuple(index['frame_size'])
+        self._animations = index['animations']
+        self._base_dir = os.path.dirname(index_path)
+        self._frames = {}
+
+    def __contains__(self, key):
+        return key in self._animations
+
+    def keys(self):
+        return self._animations.keys()
+
+    def sheet(self, name):
+        return asset_cache.get_image(os.path.join(self._base_dir, name))
+
+    def frames(self, key):
+        """Список кадров анимации key (subsurface листа)"""
+        frames = self._frames.get(key)
+        if frames is None:
+            animation = self._animations[key]
+            sheet = self.sheet(animation['sheet'])
+            frames = [sheet.subsurface(rect) for rect in animation['frames']]
+            self._frames[key] = frames
+        return frames
+
+
+_atlases = {}
+
+
+def get_atlas(index_path):
+    """Возвращает общий экземпляр атласа (индекс читается один раз)"""
+    atlas = _atlases.get(index_path)
+    if atlas is None:
+        atlas = Atlas(index_path)
+        _atlases[index_path] = atlas
+    return atlas
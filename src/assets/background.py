@@ -0,0 +1,90 @@
+import os
+import sys
+
+import pygame
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.constants import *
+from src.assets.cache import asset_cache, resource_path
+from src.assets.manifest import BACKGROUND_IMAGE
+
+
+class BackgroundService:
+    """Общий фон для игры и всех экранов интерфейса.
+
+    Исходный JPEG декодируется один раз, из него строится цепочка
+    мип-уровней (нулевой - сам оригинал, каждый следующий вдвое меньше).
+    Вариант под конкретное разрешение масштабируется из ближайшего
+    мип-уровня и хранится в asset_cache, так что все потребители получают
+    одну и ту же поверхность. Когда стартовые варианты готовы, release()
+    освобождает цепочку; новый размер потребует повторного декодирования.
+    """
+
+    MIN_MIP_SIZE = 64
+
+    def __init__(self, path=BACKGROUND_IMAGE):
+        self.path = path
+        self._mips = None
+        self._released = False  # После release() цепочка не держится между запросами
+
+    def get(self, size=(WIDTH, HEIGHT)):
+        size = (int(size[0]), int(size[1]))
+        # Готовый вариант в кэше или в бандле: ничего не декодируем
+        if not asset_cache.contains(self.path, size, alpha=False):
+            asset_cache.register(self.path, self.prepare(size), size, alpha=False)
+            if self._released:
+                self.release()
+        return asset_cache.get_image(self.path, size, alpha=False)
+
+    def prepare(self, size):
+        """Масштабированный, но еще не сконвертированный вариант.
+        Не трогает кэш, поэтому может выполняться в потоке AssetLoader."""
+        return self._scale_from_mips((int(size[0]), int(size[1])))
+
+    def _build_mips(self):
+        original = pygame.image.load(resource_path(self.path))
+        # Нулевой уровень - оригинал: размеры больше первого мип-уровня
+        # масштабируются из него, а не растягиваются из половинного
+        mips = [original]
+        level = original
+        while level.get_width() // 2 >= self.MIN_MIP_SIZE and level.get_height() // 2 >= self.MIN_MIP_SIZE:
+            level = pygame.transform.smoothscale(level, (level.get_width() // 2, level.get_height() // 2))
+            mips.append(level)
+        sizes = ', '.join(f"{mip.get_width()}x{mip.get_height()}" for mip in mips)
+        print(f"Фон {original.get_width()}x{original.get_height()} разложен на мип-уровни: {sizes}")
+        return mips
+
+    def _scale_from_mips(self, size):
+        if self._mips is None:
+            self._mips = self._build_mips()
+        # Берем самый маленький уровень, который еще не меньше нужного размера
+        source = self._mips[0]
+        for mip in self._mips:
+            if mip.get_width() >= size[0] and mip.get_height() >= size[1]:
+                source = mip
+        if source.get_size() == size:
+            return source.copy()
+        return pygame.transform.smoothscale(source, size)
+
+    def bytes_held(self):
+        if not self._mips:
+            return 0
+        return sum(mip.get_pitch() * mip.get_height() for mip in self._mips)
+
+    def release(self):
+        """Освобождает цепочку мип-уровней: готовые варианты уже в asset_cache"""
+        freed = self.bytes_held()
+        self._mips = None
+        self._released = True
+        if freed:
+            print(f"Фон: мип-уровни освобождены, {freed / 1024:.1f} KB")
+        return freed
+
+
+# Общий экземпляр для всей игры
+background_service = BackgroundService()
+
+
+def get_background(size=(WIDTH, HEIGHT)):
+    return background_service.get(size)
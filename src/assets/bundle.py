@@ -0,0 +1,90 @@
+import json
+import mmap
+import os
+import struct
+import sys
+
+import pygame
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.assets.cache import resource_path
+
+# Формат файла:
+#   заголовок  HEADER (magic, версия, длина индекса)
+#   индекс     JSON со списком записей
+#   данные     сырые пиксели каждой записи, выровненные по BLOB_ALIGN
+MAGIC = b'SMRB'
+VERSION = 1
+HEADER = struct.Struct('<4sII')
+BLOB_ALIGN = 64
+PIXEL_FORMAT = 'BGRA'  # совпадает с форматом convert_alpha() на 32-битном экране
+BUNDLE_PATH = 'assets.bundle'
+
+
+class AssetBundle:
+    """Предсобранный бандл уже масштабированных изображений.
+
+    Файл отображается в память через mmap, поверхности создаются через
+    pygame.image.frombuffer прямо поверх отображения, без декодирования
+    JPEG/PNG и без копирования пикселей. Бандл создается утилитой
+    tools/build_bundle.py.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        # ACCESS_COPY: если кто-то рисует поверх такой поверхности,
+        # изменения не попадут в файл
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Неподдерживаемый формат бандла: {path}")
+        index = json.loads(self._map[HEADER.size:HEADER.size + index_length].decode('utf-8'))
+        self._view = memoryview(self._map)
+
+        self._entries = {}
+        self._native_sizes = {}
+        for entry in index['entries']:
+            # В индексе пути хранятся с '/', игра строит их через os.path.join
+            entry_path = entry['path'].replace('/', os.sep)
+            size = tuple(entry['size']) if entry['size'] is not None else None
+            self._entries[(entry_path, size, entry['alpha'])] = entry
+            self._native_sizes[entry_path] = tuple(entry['native_size'])
+
+    def __len__(self):
+        return len(self._entries)
+
+    def has_path(self, path):
+        return path in self._native_sizes
+
+    def has_entry(self, path, size=None, alpha=True):
+        return (path, size, alpha) in self._entries
+
+    def native_size(self, path):
+        return self._native_sizes.get(path)
+
+    def get_image(self, path, size=None, alpha=True):
+        """Поверхность поверх данных бандла или None, если такой записи нет"""
+        entry = self._entries.get((path, size, alpha))
+        if entry is None:
+            return None
+        start = entry['offset']
+        data = self._view[start:start + entry['length']]
+        surface = pygame.image.frombuffer(data, (entry['width'], entry['height']), entry['format'])
+        if not alpha:
+            # Непрозрачные изображения рисуем без смешивания
+            surface.set_alpha(None)
+        return surface
+
+
+def open_bundle(path=BUNDLE_PATH):
+    """Открывает бандл, если он есть рядом с игрой, иначе возвращает None"""
+    full_path = resource_path(path)
+    if not os.path.exists(full_path):
+        return None
+    try:
+        return AssetBundle(full_path)
+    except Exception as e:
+        print(f"Не удалось открыть бандл {full_path}: {e}")
+        return None
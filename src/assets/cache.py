@@ -0,0 +1,170 @@
+import pygame
+import sys
+import os
+
+
+# Helper function to get correct resource path
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        # Not running in a PyInstaller bundle
+        # Папка images находится на два уровня выше src/assets/
+        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    return os.path.join(base_path, relative_path)
+
+
+def display_format(surface, alpha=False):
+    """Поверхность в формате экрана (convert или convert_alpha), чтобы блит
+    не пересчитывал пиксели. Без открытого окна конвертировать не во что -
+    возвращается как есть."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+class AssetCache:
+    """Общий кэш изображений.
+
+    Каждый файл декодируется один раз, каждая пара (путь, размер)
+    масштабируется и конвертируется в формат экрана тоже один раз.
+    Пути задаются относительно корня игры, например
+    os.path.join('images', 'backgrownd.jpg').
+    """
+
+    def __init__(self):
+        self._originals = {}     # путь -> декодированное исходное изображение
+        self._native_sizes = {}  # путь -> исходный размер (переживает release_originals)
+        self._surfaces = {}      # (путь, размер, alpha) -> готовая поверхность
+        self._mapped = set()     # ключи поверхностей, которые лежат в памяти бандла
+        self._bundle = None
+        self.hits = 0
+        self.misses = 0
+
+    def attach_bundle(self, bundle):
+        """Подключает предсобранный бандл (src/assets/bundle.py).
+        Записи бандла отдаются вместо декодирования исходных файлов."""
+        self._bundle = bundle
+
+    def has(self, path):
+        """Есть ли такое изображение в бандле или на диске"""
+        if self._bundle is not None and self._bundle.has_path(path):
+            return True
+        return os.path.exists(resource_path(path))
+
+    def get_image(self, path, size=None, alpha=True):
+        """Возвращает изображение, масштабированное до size и
+        сконвертированное в формат экрана (convert_alpha, если alpha)."""
+        size = tuple(int(v) for v in size) if size is not None else None
+        key = (path, size, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if self._bundle is not None:
+            mapped = self._bundle.get_image(path, size, alpha)
+            if mapped is not None:
+                surface = self._adopt(mapped, alpha)
+                self._surfaces[key] = surface
+                if surface is mapped:
+                    self._mapped.add(key)
+                return surface
+
+        # Без масштабирования оригинал заменяется сконвертированной поверхностью,
+        # хранить его незачем (в том числе после release_originals)
+        image = self._load_original(path, keep=size is not None)
+        if size is not None and image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        surface = display_format(image, alpha)
+        self._surfaces[key] = surface
+        return surface
+
+    def contains(self, path, size=None, alpha=True):
+        """Можно ли получить изображение без декодирования файла"""
+        size = tuple(int(v) for v in size) if size is not None else None
+        if (path, size, alpha) in self._surfaces:
+            return True
+        return self._bundle is not None and self._bundle.has_entry(path, size, alpha)
+
+    def register(self, path, surface, size=None, alpha=True):
+        """Кладет в кэш поверхность, подготовленную снаружи (например,
+        фон из мип-уровней), и возвращает ее сконвертированную версию"""
+        size = tuple(int(v) for v in size) if size is not None else None
+        surface = display_format(surface, alpha)
+        self._surfaces[(path, size, alpha)] = surface
+        return surface
+
+    def native_size(self, path):
+        """Исходный размер файла (без масштабирования)"""
+        if path not in self._native_sizes:
+            if self._bundle is not None and self._bundle.has_path(path):
+                return self._bundle.native_size(path)
+            self._load_original(path)
+        return self._native_sizes[path]
+
+    def release_originals(self):
+        """Освобождаем исходные (немасштабированные) изображения.
+        Уже подготовленные поверхности остаются в кэше."""
+        self._originals.clear()
+
+    def clear(self):
+        self._originals.clear()
+        self._surfaces.clear()
+        self._mapped.clear()
+
+    def _load_original(self, path, keep=True):
+        image = self._originals.get(path)
+        if image is None:
+            image = pygame.image.load(resource_path(path))
+            if keep:
+                self._originals[path] = image
+            self._native_sizes[path] = image.get_size()
+        return image
+
+    @staticmethod
+    def _adopt(surface, alpha):
+        # Данные бандла уже в формате экрана: конвертация (и копия) не нужна
+        display = pygame.display.get_surface()
+        if display is None or (surface.get_bitsize() == display.get_bitsize() and
+                               surface.get_masks()[:3] == display.get_masks()[:3]):
+            return surface
+        return display_format(surface, alpha)
+
+    @staticmethod
+    def _surface_bytes(surface):
+        # Подповерхности делят пиксели с родителем, их не считаем
+        if surface.get_parent() is not None:
+            return 0
+        return surface.get_pitch() * surface.get_height()
+
+    def bytes_held(self):
+        surfaces = [surface for key, surface in self._surfaces.items() if key not in self._mapped]
+        surfaces += list(self._originals.values())
+        return sum(self._surface_bytes(surface) for surface in surfaces)
+
+    def bytes_mapped(self):
+        return sum(self._surface_bytes(self._surfaces[key]) for key in self._mapped)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._surfaces),
+            'originals': len(self._originals),
+            'bytes': self.bytes_held(),
+            'mapped_bytes': self.bytes_mapped(),
+        }
+
+    def report(self):
+        stats = self.stats()
+        print(f"AssetCache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} surfaces, {stats['originals']} originals, "
+              f"{stats['bytes'] / 1024:.1f} KB, {stats['mapped_bytes'] / 1024:.1f} KB mapped")
+
+
+# Общий экземпляр для всей игры
+asset_cache = AssetCache()
@@ -0,0 +1,85 @@
+import os
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.assets.cache import asset_cache, resource_path
+
+
+def _decode(path, size):
+    """Выполняется в рабочем потоке: только декодирование и масштабирование.
+    convert()/convert_alpha() требуют окна и делаются в главном потоке."""
+    image = pygame.image.load(resource_path(path))
+    if size is not None and image.get_size() != size:
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+class AssetLoader:
+    """Фоновая загрузка ресурсов пулом потоков.
+
+    Рабочие потоки декодируют изображения и складывают результаты в
+    потокобезопасную очередь. Главный поток вызывает poll() между кадрами:
+    забирает готовые поверхности, конвертирует их и кладет в asset_cache.
+    """
+
+    def __init__(self, max_workers=4, cache=asset_cache):
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='asset-loader')
+        self._results = queue.Queue()
+        self.total = 0
+        self.completed = 0
+        self.errors = []
+
+    def submit_image(self, path, size=None, alpha=True):
+        size = tuple(size) if size is not None else None
+        if self.cache.contains(path, size, alpha):
+            # Уже в кэше или в бандле: декодировать нечего
+            return
+        self.submit((path, size, alpha), _decode, path, size)
+
+    def submit(self, key, func, *args):
+        """Ставит в очередь произвольную задачу: func(*args) в рабочем потоке
+        должна вернуть поверхность, которая попадет в кэш под ключом key
+        (путь, размер, alpha)."""
+        self.total += 1
+        self._executor.submit(self._run, key, func, args)
+
+    def _run(self, key, func, args):
+        try:
+            self._results.put((key, func(*args), None))
+        except Exception as e:
+            self._results.put((key, None, e))
+
+    def poll(self):
+        """Забирает готовые результаты (только из главного потока)"""
+        while True:
+            try:
+                key, surface, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self.completed += 1
+            path, size, alpha = key
+            if error is not None:
+                print(f"Ошибка фоновой загрузки {path}: {error}")
+                self.errors.append((path, error))
+                continue
+            self.cache.register(path, surface, size, alpha)
+        return self.completed
+
+    @property
+    def done(self):
+        return self.completed >= self.total
+
+    @property
+    def progress(self):
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,62 @@
+import os
+
+from src.constants import WIDTH, HEIGHT, ENEMY_WIDTH, ENEMY_HEIGHT
+
+# Список исходных файлов, из которых собираются атласы и бандлы.
+# Пути задаются относительно корня игры.
+
+PLAYER_ANIMATION_SOURCES = {
+    'right': [os.path.join('images', 'player_run', 'player_right', f'player_right{i}.png') for i in range(1, 9)],
+    'left': [os.path.join('images', 'player_run', 'player_left', f'player_left{i}.png') for i in range(1, 9)],
+    'jump_right': [os.path.join('images', 'player_jump', 'jumpr', f'Jump{i}r.png') for i in range(1, 5)],
+    'jump_left': [os.path.join('images', 'player_jump', 'jumpl', f'Jump{i}l.png') for i in range(1, 5)],
+    'attack_right': [os.path.join('images', 'player_Attack', 'Attak', filename)
+                     for filename in ('Attack1r.png', 'Attack2.png', 'Attack3.png', 'Attack4.png')],
+    'dead': [os.path.join('images', 'player_dead', f'Dead{i}.png') for i in range(1, 7)],
+}
+
+# Анимации, которые получаются зеркальным отражением другой анимации
+PLAYER_FLIPPED_ANIMATIONS = {
+    'attack_left': 'attack_right',
+}
+
+# Анимации, которые масштабируются по высоте игрока с сохранением пропорций
+PLAYER_KEEP_ASPECT_ANIMATIONS = ('attack_right',)
+
+PLAYER_ATLAS_INDEX = os.path.join('images', 'atlas', 'player.json')
+
+# Листы атласа: бег и прыжок нужны сразу, атака и смерть подгружаются позже
+PLAYER_ATLAS_SHEETS = {
+    'player.png': ('right', 'left', 'jump_right', 'jump_left'),
+    'player_extra.png': ('attack_right', 'attack_left', 'dead'),
+}
+
+# Анимации, которые загружаются вместе с игроком; остальные - при первом обращении
+PLAYER_EAGER_ANIMATIONS = ('right', 'left')
+
+BACKGROUND_IMAGE = os.path.join('images', 'backgrownd.jpg')
+PLATFORM_TEXTURE_FILES = [os.path.join('images', 'city', f'platform{i}.png') for i in range(1, 4)]
+ENEMY_TEXTURE = os.path.join('images', 'enemies', 'robot_flor.png')
+PLAYER_ATLAS_SHEET = os.path.join('images', 'atlas', 'player.png')
+PLAYER_ATLAS_EXTRA_SHEET = os.path.join('images', 'atlas', 'player_extra.png')
+
+
+def startup_images():
+    """Изображения, нужные при запуске: (путь, размер, alpha) ровно в том виде,
+    в каком их запрашивает игра."""
+    entries = [(BACKGROUND_IMAGE, (WIDTH, HEIGHT), False)]
+    # Текстуры платформ хранятся в исходном размере, см. src/world/platform_textures.py
+    entries += [(path, None, True) for path in PLATFORM_TEXTURE_FILES]
+    entries.append((ENEMY_TEXTURE, (ENEMY_WIDTH, ENEMY_HEIGHT), True))
+    entries.append((PLAYER_ATLAS_SHEET, None, True))
+    return entries
+
+
+def deferred_images():
+    """Изображения, которые загружаются лениво (после появления меню)"""
+    return [(PLAYER_ATLAS_EXTRA_SHEET, None, True)]
+
+
+def bundle_images():
+    """Все, что попадает в бандл"""
+    return startup_images() + deferred_images()
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TransformCache:
+    """Кэш преобразованных поверхностей (отражение, масштаб, поворот).
+
+    Ключ - исходная поверхность и параметры преобразования, поэтому
+    повторный вызов с теми же аргументами возвращает уже готовую
+    поверхность вместо создания новой в каждом кадре. Размер кэша
+    ограничен, давно не использованные варианты вытесняются (LRU).
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        # ключ -> (исходная поверхность, результат). Исходник храним, чтобы
+        # его id не мог достаться другой поверхности, пока запись жива
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, surface, key, build):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is surface:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = build()
+        self._entries[key] = (surface, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def flip(self, surface, flip_x=True, flip_y=False):
+        key = (id(surface), 'flip', bool(flip_x), bool(flip_y))
+        return self._get(surface, key, lambda: pygame.transform.flip(surface, flip_x, flip_y))
+
+    def scale(self, surface, size):
+        size = (int(size[0]), int(size[1]))
+        key = (id(surface), 'scale', size)
+        return self._get(surface, key, lambda: pygame.transform.scale(surface, size))
+
+    def rotate(self, surface, angle):
+        key = (id(surface), 'rotate', angle)
+        return self._get(surface, key, lambda: pygame.transform.rotate(surface, angle))
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'hit_rate': self.hit_rate,
+        }
+
+    def report(self):
+        print(f"TransformCache: {self.hits} hits, {self.misses} misses, "
+              f"{self.evictions} evictions, {len(self._entries)} entries, "
+              f"hit rate {self.hit_rate * 100:.1f}%")
+
+
+# Общий экземпляр для всей игры
+transform_cache = TransformCache()
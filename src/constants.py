@@ -1,10 +1,39 @@
+import os
+
 import pygame
 
 # Display settings
 WIDTH = 800
 HEIGHT = 600
 LEVEL_WIDTH = 3200  # 4 screens wide
-FPS = 60
+FPS = 60  # Ограничение частоты кадров отрисовки
+
+# Симуляция идет фиксированными тиками SIM_RATE раз в секунду независимо от
+# частоты кадров, отрисовка интерполирует между двумя последними тиками.
+# Скорости и ускорения ниже заданы на тик частотой PHYSICS_REFERENCE_RATE
+# и пересчитываются на тик симуляции через SIM_STEP_SCALE. Частоту можно
+# задать переменной окружения SIM_RATE (например, реже для прогонов без окна)
+SIM_RATE = int(os.environ.get('SIM_RATE', 60))
+PHYSICS_REFERENCE_RATE = 60
+SIM_STEP_SCALE = PHYSICS_REFERENCE_RATE / SIM_RATE
+MAX_FRAME_TIME = 0.25  # После долгой паузы симуляция догоняет не больше 0.25 с
+DIRTY_RECTS = True  # Выводить на экран только изменившиеся области
+
+# Режим тестирования (переменная окружения ALLOC_CHECK=1): кадр игрового
+# процесса (update + draw) не должен выделять больше FRAME_ALLOC_BUDGET байт
+ALLOC_CHECK = os.environ.get('ALLOC_CHECK') == '1'
+FRAME_ALLOC_BUDGET = 8 * 1024
+ALLOC_CHECK_WARMUP_FRAMES = 60  # Кадров на прогрев кэшей после смены состояния
+
+# Запись ввода (переменная окружения REPLAY_RECORD=путь): ввод каждого тика
+# первой попытки прохождения уровня сохраняется в файл для tools/replay.py
+REPLAY_RECORD = os.environ.get('REPLAY_RECORD')
+
+# Слои параллакса: (коэффициент прокрутки относительно мира, смещение по Y).
+# Сейчас слой один - общий фон, он движется вдвое медленнее мира
+PARALLAX_LAYERS = [
+    (0.5, 0),
+]
 
 # Colors
 WHITE = (255, 255, 255)
@@ -33,6 +62,8 @@ ANIMATION_FRAME_SPEED = 8  # Кадров в секунду для анимац
 # Platform settings
 PLATFORM_WIDTH = 100  # Уменьшаем ширину платформы
 PLATFORM_HEIGHT = 40  # Оптимальная высота для платформы
+PLATFORM_CAP_WIDTH = 40  # Ширина краев текстуры, которые не повторяются при растягивании
+PLATFORM_GRID_CELL = 128  # Размер ячейки сетки платформ для проверки столкновений
 
 # Enemy settings
 ENEMY_WIDTH = 60
@@ -40,6 +71,11 @@ ENEMY_HEIGHT = 60
 ENEMY_SPEED = 2
 ENEMY_PATROL_RANGE = 150
 
+# Effects settings
+PARTICLE_CAPACITY = 4096  # Слотов в системе частиц игрового мира
+PARTICLE_GRAVITY = 0.15
+LANDING_DUST_MIN_SPEED = 4  # Пыль поднимается только при приземлении с такой скорости
+
 # Animation settings
 ANIMATION_SPEED = 0.2
 ATTACK_ANIMATION_SPEED = 0.15
@@ -0,0 +1,92 @@
+import tracemalloc
+
+
+class FrameBudgetExceeded(AssertionError):
+    """Кадр выделил больше памяти, чем позволяет бюджет"""
+
+
+class FrameAllocationBudget:
+    """Проверка выделений памяти за кадр через tracemalloc (режим тестирования).
+
+    Кадр обрамляется вызовами begin_frame(state) и end_frame(state). Для
+    проверяемых состояний после warmup_frames кадров подряд (кэши,
+    чанки и спрайты уже созданы) считается пик памяти, выделенной за
+    кадр, включая временные объекты. Если он больше budget_bytes,
+    бросается FrameBudgetExceeded со строками кода, после которых
+    осталось больше всего памяти (по разнице снимков до и после кадра).
+
+    Учитывается только то, что проходит через аллокатор Python и NumPy:
+    пиксели поверхностей выделяет SDL, но сам объект Surface тоже виден.
+    """
+
+    def __init__(self, budget_bytes, warmup_frames=60, states=None, traceback_limit=10):
+        self.budget_bytes = budget_bytes
+        self.warmup_frames = warmup_frames
+        self.states = states  # None - проверять все состояния
+        self.traceback_limit = traceback_limit
+
+        self._state = None
+        self._run = 0
+        self._checking = False
+        self._snapshot = None
+        self._start = 0
+
+        self.frames_checked = 0
+        self.worst_bytes = 0
+        self.total_bytes = 0
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_limit)
+
+    def stop(self):
+        self._snapshot = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def begin_frame(self, state):
+        if state != self._state:
+            self._state = state
+            self._run = 0
+        self._run += 1
+        self._checking = (self._run > self.warmup_frames and
+                          (self.states is None or state in self.states) and
+                          tracemalloc.is_tracing())
+        if not self._checking:
+            return
+        self._snapshot = tracemalloc.take_snapshot()
+        self._start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def end_frame(self, state):
+        if not self._checking:
+            return
+        allocated = tracemalloc.get_traced_memory()[1] - self._start
+        self._checking = False
+        if state != self._state:
+            # Кадр сменил состояние игры (переход экрана) - это не установившийся режим
+            self._snapshot = None
+            return
+
+        self.frames_checked += 1
+        self.total_bytes += allocated
+        self.worst_bytes = max(self.worst_bytes, allocated)
+        if allocated > self.budget_bytes:
+            raise FrameBudgetExceeded(self._describe(allocated))
+        self._snapshot = None
+
+    def _describe(self, allocated):
+        lines = [f"Frame {self._run} in state {self._state} allocated {allocated} B "
+                 f"(budget {self.budget_bytes} B). Largest allocations still alive "
+                 f"after the frame (freed temporaries are not listed):"]
+        after = tracemalloc.take_snapshot()
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        stats = after.filter_traces(ignore).compare_to(self._snapshot.filter_traces(ignore), 'lineno')
+        for stat in [stat for stat in stats if stat.size_diff > 0][:5]:
+            lines.append(f"  {stat}")
+        return "\n".join(lines)
+
+    def report(self):
+        average = self.total_bytes / self.frames_checked if self.frames_checked else 0.0
+        print(f"FrameAllocationBudget: {self.frames_checked} frames checked, "
+              f"average {average:.0f} B, worst {self.worst_bytes} B, budget {self.budget_bytes} B")
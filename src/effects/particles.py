@@ -0,0 +1,180 @@
+import os
+import sys
+
+import numpy
+import pygame
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.assets.cache import display_format
+
+_NO_SPRITES = ()
+
+
+def _range(value):
+    """Число или пара (от, до) -> пара (от, до)"""
+    if isinstance(value, (tuple, list)):
+        return value[0], value[1]
+    return value, value
+
+
+def circle_sprite(color, radius):
+    """Круг радиуса radius на поверхности с цветовым ключом. Блит в
+    (x - radius, y - radius) дает те же пиксели, что pygame.draw.circle
+    с центром (x, y)."""
+    colorkey = tuple(255 - channel for channel in color[:3])  # гарантированно не совпадает с цветом
+    sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+    sprite.fill(colorkey)
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+    sprite.set_colorkey(colorkey)
+    return display_format(sprite)
+
+
+class ParticleSystem:
+    """Частицы в заранее выделенных массивах NumPy.
+
+    Позиции, скорости, время жизни и вид частицы (цвет и радиус) лежат в
+    массивах на capacity слотов. Обновление - несколько векторных операций
+    над занятой частью массивов, погибшие частицы освобождают слоты для
+    новых. Отрисовка - один Surface.blits из готовых спрайтов-кругов.
+    Скорости, ускорение и время жизни заданы на тик update(dt=1).
+    """
+
+    def __init__(self, capacity=1024, gravity=0.0, seed=None):
+        self.capacity = capacity
+        self.gravity = gravity
+        self.rng = numpy.random.default_rng(seed)
+
+        self.x = numpy.zeros(capacity)
+        self.y = numpy.zeros(capacity)
+        self.vx = numpy.zeros(capacity)
+        self.vy = numpy.zeros(capacity)
+        self.life = numpy.zeros(capacity, dtype=numpy.float32)
+        self.radius = numpy.zeros(capacity, dtype=numpy.int32)
+        self.kind = numpy.zeros(capacity, dtype=numpy.int32)
+        self.alive = numpy.zeros(capacity, dtype=bool)
+        # Рабочие массивы update()
+        self._mask = numpy.zeros(capacity, dtype=bool)
+        self._step = numpy.zeros(capacity)
+        # Слоты с индексом >= _top заведомо свободны, обновляется только [:_top]
+        self._top = 0
+
+        # Вид частицы: (цвет, радиус) -> номер, номер -> спрайт
+        self._kinds = {}
+        self._sprites = []
+        self.dropped = 0
+        # Пары [спрайт, [x, y]] для отрисовки переиспользуются между кадрами
+        self._pairs = []
+        self._items = []
+
+    def _kind(self, color, radius):
+        key = (tuple(color), int(radius))
+        kind = self._kinds.get(key)
+        if kind is None:
+            kind = len(self._sprites)
+            self._sprites.append(circle_sprite(key[0], key[1]))
+            self._kinds[key] = kind
+        return kind
+
+    @property
+    def count(self):
+        return int(numpy.count_nonzero(self.alive[:self._top]))
+
+    def emit(self, count, x, y, vx=0.0, vy=0.0, lifetime=30, colors=((255, 255, 255),), sizes=(1,)):
+        """Выпускает count частиц. x, y, vx, vy - число или диапазон
+        (от, до) для равномерного разброса; lifetime - число или диапазон
+        тиков (включительно); цвет и радиус выбираются из colors и sizes.
+        Возвращает число выпущенных частиц (при нехватке слотов меньше count)."""
+        # За _top все слоты свободны, поэтому искать дальше _top + count не нужно
+        end = min(self.capacity, self._top + count)
+        free = numpy.flatnonzero(~self.alive[:end])[:count]
+        emitted = len(free)
+        self.dropped += count - emitted
+        if not emitted:
+            return 0
+
+        rng = self.rng
+        self.x[free] = rng.uniform(*_range(x), emitted)
+        self.y[free] = rng.uniform(*_range(y), emitted)
+        self.vx[free] = rng.uniform(*_range(vx), emitted)
+        self.vy[free] = rng.uniform(*_range(vy), emitted)
+        low, high = _range(lifetime)
+        self.life[free] = rng.integers(low, high, emitted, endpoint=True)
+
+        kinds = numpy.array([self._kind(color, size) for color in colors for size in sizes])
+        choice = rng.integers(0, len(kinds), emitted)
+        self.kind[free] = kinds[choice]
+        self.radius[free] = numpy.array([size for color in colors for size in sizes])[choice]
+
+        self.alive[free] = True
+        self._top = max(self._top, int(free[-1]) + 1)
+        return emitted
+
+    def update(self, dt=1.0):
+        """Продвигает частицы на dt тиков"""
+        top = self._top
+        if not top:
+            return
+        alive = self.alive[:top]
+        life = self.life[:top]
+        mask = self._mask[:top]
+        numpy.subtract(life, dt, out=life)
+        numpy.greater(life, 0, out=mask)
+        alive &= mask
+        vy = self.vy[:top]
+        vy += self.gravity * dt
+        step = self._step[:top]
+        numpy.multiply(self.vx[:top], dt, out=step)
+        self.x[:top] += step
+        numpy.multiply(vy, dt, out=step)
+        self.y[:top] += step
+
+        if not alive[top - 1]:
+            # Погибла последняя занятая частица: сдвигаем границу занятой части
+            live = numpy.flatnonzero(alive)
+            self._top = int(live[-1]) + 1 if len(live) else 0
+
+    def sprites(self, offset_x=0, offset_y=0):
+        """Пары (спрайт, позиция) живых частиц со сдвигом (offset_x, offset_y)"""
+        if not self._top:
+            return _NO_SPRITES
+        live = numpy.flatnonzero(self.alive[:self._top])
+        if not len(live):
+            return _NO_SPRITES
+        radius = self.radius[live]
+        xs = (self.x[live].astype(numpy.int32) - radius + int(offset_x)).tolist()
+        ys = (self.y[live].astype(numpy.int32) - radius + int(offset_y)).tolist()
+        sprites = self._sprites
+        pairs = self._pairs
+        while len(pairs) < len(xs):
+            pairs.append([None, [0, 0]])
+        items = self._items
+        items.clear()
+        for pair, kind, px, py in zip(pairs, self.kind[live].tolist(), xs, ys):
+            pair[0] = sprites[kind]
+            dest = pair[1]
+            dest[0] = px
+            dest[1] = py
+            items.append(pair)
+        return items
+
+    def draw(self, surface, offset_x=0, offset_y=0):
+        """Рисует живые частицы и возвращает список затронутых прямоугольников"""
+        items = self.sprites(offset_x, offset_y)
+        return surface.blits(items) if items else []
+
+    def clear(self):
+        self.alive[:] = False
+        self._top = 0
+
+
+def hit_sparks(system, x, y, count=24):
+    """Искры от удара в точке (x, y)"""
+    return system.emit(count, (x - 4, x + 4), (y - 4, y + 4), vx=(-4.0, 4.0), vy=(-5.0, 1.0),
+                       lifetime=(10, 25), colors=((255, 215, 0), (255, 255, 255), (255, 140, 0)), sizes=(1, 2))
+
+
+def landing_dust(system, x, y, width, count=16):
+    """Пыль из-под ног при приземлении на отрезок [x, x + width] на высоте y"""
+    return system.emit(count, (x, x + width), (y - 2, y), vx=(-1.5, 1.5), vy=(-1.2, -0.2),
+                       lifetime=(12, 24), colors=((150, 140, 120), (110, 100, 90)), sizes=(1, 2, 3))
@@ -1,4 +1,3 @@
-import pygame
 import random
 import math
 import sys
@@ -7,35 +6,54 @@ import os
 # Add the game root directory to Python path
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
 from src.constants import *
+from src.enemies.enemy_types import get_enemy_type, DEFAULT_ENEMY_TYPE
 
 class Enemy:
-    def __init__(self, x, y):
+    # Только собственное состояние; общие параметры лежат в EnemyType
+    __slots__ = ('type', 'x', 'y', 'prev_x', 'direction', 'alive', 'initial_x', 'initial_y', '_sprite')
+
+    def __init__(self, x, y, enemy_type=DEFAULT_ENEMY_TYPE):
+        self.type = get_enemy_type(enemy_type) if isinstance(enemy_type, str) else enemy_type
         self.x = x
         self.y = y
-        self.width = ENEMY_WIDTH
-        self.height = ENEMY_HEIGHT
-        self.speed = ENEMY_SPEED
+        self.prev_x = x  # Положение на прошлом тике, для интерполяции при отрисовке
         self.direction = 1  # 1 for right, -1 for left
         self.alive = True
         self.initial_x = x
         self.initial_y = y
-        self.patrol_range = ENEMY_PATROL_RANGE
-        
-        # Load enemy texture
-        try:
-            root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            img_path = os.path.join(root_dir, 'images', 'enemies', 'robot_flor.png')
-            self.texture = pygame.image.load(img_path)
-            self.texture = pygame.transform.scale(self.texture, (self.width, self.height))
-        except:
-            self.texture = None
+        self._sprite = None  # [текстура, [x, y]], создается при первой отрисовке
+
+    @property
+    def width(self):
+        return self.type.width
+
+    @property
+    def height(self):
+        return self.type.height
+
+    @property
+    def speed(self):
+        return self.type.speed
+
+    @property
+    def patrol_range(self):
+        return self.type.patrol_range
+
+    @property
+    def texture(self):
+        return self.type.texture
+
+    def patrol_bounds(self):
+        """Горизонтальный интервал, который враг не покидает при патрулировании"""
+        return self.initial_x - self.patrol_range, self.initial_x + self.patrol_range + self.width
 
     def move(self, player):
         if not self.alive:
             return
             
-        # Simple patrol behavior
-        self.x += self.speed * self.direction
+        # Simple patrol behavior (один тик симуляции)
+        self.prev_x = self.x
+        self.x += self.speed * self.direction * SIM_STEP_SCALE
         
         # Change direction if reached patrol limit
         if self.x > self.initial_x + self.patrol_range:
@@ -45,18 +63,29 @@ class Enemy:
             self.x = self.initial_x - self.patrol_range
             self.direction = 1
 
-    def draw(self, screen, camera):
+    def sprite(self, camera, alpha=1.0):
+        """Пара (поверхность, позиция на экране) для пакетной отрисовки,
+        None - если враг мертв. alpha - доля тика для интерполяции положения"""
         if not self.alive:
-            return
-            
-        enemy_rect = camera.apply(self)
-        if hasattr(self, 'texture') and self.texture:
-            # Flip the texture based on direction
-            if self.direction < 0:
-                flipped_texture = pygame.transform.flip(self.texture, True, False)
-                screen.blit(flipped_texture, enemy_rect)
-            else:
-                screen.blit(self.texture, enemy_rect)
-        else:
+            return None
+        # Flip the texture based on direction
+        texture = self.type.flipped_texture if self.direction < 0 else self.texture
+        if not texture:
             # Fallback to rectangle if texture not available
-            pygame.draw.rect(screen, RED, enemy_rect)
+            texture = self.type.fallback_texture
+        # Пара переиспользуется между кадрами и обновляется на месте
+        sprite = self._sprite
+        if sprite is None:
+            sprite = self._sprite = [texture, [0, 0]]
+        sprite[0] = texture
+        dest = sprite[1]
+        dest[0] = self.prev_x + (self.x - self.prev_x) * alpha - camera.camera.x
+        dest[1] = self.y
+        return sprite
+
+    def draw(self, screen, camera):
+        """Рисует врага и возвращает затронутый прямоугольник (None, если враг мертв)"""
+        sprite = self.sprite(camera)
+        if sprite is None:
+            return None
+        return screen.blit(sprite[0], sprite[1])
@@ -0,0 +1,74 @@
+import sys
+import os
+
+import pygame
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.constants import *
+from src.assets.cache import asset_cache
+from src.assets.transforms import transform_cache
+from src.assets.manifest import ENEMY_TEXTURE
+
+
+class EnemyType:
+    """Общие параметры вида врагов (flyweight): текстура, размер, скорость
+    и дальность патрулирования. Экземпляры Enemy хранят только ссылку на
+    вид и собственное состояние, поэтому новый враг не обращается к диску
+    и почти не занимает памяти."""
+
+    def __init__(self, name, texture_path, width, height, speed, patrol_range):
+        self.name = name
+        self.texture_path = texture_path
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.patrol_range = patrol_range
+        self._texture = None
+        self._texture_loaded = False
+        self._fallback_texture = None
+
+    @property
+    def texture(self):
+        # Загружаем при первом обращении: к этому моменту окно уже создано
+        if not self._texture_loaded:
+            self._texture_loaded = True
+            try:
+                self._texture = asset_cache.get_image(self.texture_path, (self.width, self.height))
+            except Exception as e:
+                print(f"Не удалось загрузить текстуру врага {self.name}: {e}")
+                self._texture = None
+        return self._texture
+
+    @property
+    def flipped_texture(self):
+        texture = self.texture
+        if texture is None:
+            return None
+        return transform_cache.flip(texture, True, False)
+
+    @property
+    def fallback_texture(self):
+        """Красный прямоугольник размера врага на случай, если текстуры нет"""
+        if self._fallback_texture is None:
+            self._fallback_texture = pygame.Surface((self.width, self.height))
+            self._fallback_texture.fill(RED)
+        return self._fallback_texture
+
+
+ENEMY_TYPES = {}
+
+
+def register_enemy_type(enemy_type):
+    ENEMY_TYPES[enemy_type.name] = enemy_type
+    return enemy_type
+
+
+def get_enemy_type(name):
+    return ENEMY_TYPES[name]
+
+
+DEFAULT_ENEMY_TYPE = 'robot'
+
+register_enemy_type(EnemyType(DEFAULT_ENEMY_TYPE, ENEMY_TEXTURE, ENEMY_WIDTH, ENEMY_HEIGHT,
+                              ENEMY_SPEED, ENEMY_PATROL_RANGE))
@@ -0,0 +1,122 @@
+import os
+import struct
+import sys
+
+import pygame
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.constants import *
+
+# Формат файла:
+#   заголовок  HEADER (magic, версия, частота симуляции, число тиков,
+#              итоговое состояние игры, итоговый счет, число серий)
+#   серии      RUN (маска ввода, длина) - подряд идущие тики с одинаковым вводом
+# Маска ввода тика: биты 0-3 - зажатые REPLAY_KEYS, биты 4-7 - нажатые с прошлого тика
+MAGIC = b'SMRR'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIbiI')
+RUN = struct.Struct('<BH')
+MAX_RUN = 0xFFFF
+REPLAY_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_q)
+
+
+def encode_input(held, pressed):
+    """(зажатые, нажатые) клавиши тика -> маска ввода"""
+    mask = 0
+    for bit, key in enumerate(REPLAY_KEYS):
+        if key in held:
+            mask |= 1 << bit
+        if key in pressed:
+            mask |= 0x10 << bit
+    return mask
+
+
+def decode_input(mask):
+    """Маска ввода -> (зажатые, нажатые) клавиши тика"""
+    held = frozenset(key for bit, key in enumerate(REPLAY_KEYS) if mask & (1 << bit))
+    pressed = frozenset(key for bit, key in enumerate(REPLAY_KEYS) if mask & (0x10 << bit))
+    return held, pressed
+
+
+class InputRecorder:
+    """Запись ввода одной попытки прохождения уровня, тик за тиком.
+
+    Game.update вызывает record() на каждом тике игрового процесса и
+    finish(), когда игра закончилась проигрышем или победой (или при
+    выходе). Ввод хранится сериями одинаковых масок, поэтому минута
+    бега вправо занимает несколько байт."""
+
+    def __init__(self, path):
+        self.path = path
+        self.ticks = 0
+        self.runs = []  # [маска, длина]
+        self.finished = False
+
+    def record(self, held, pressed):
+        if self.finished:
+            return
+        mask = encode_input(held, pressed)
+        runs = self.runs
+        if runs and runs[-1][0] == mask and runs[-1][1] < MAX_RUN:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+        self.ticks += 1
+
+    def finish(self, game_state, score):
+        """Сохраняет запись с итогом попытки; повторные вызовы ничего не делают"""
+        if self.finished or not self.ticks:
+            return
+        self.finished = True
+        with open(self.path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, SIM_RATE, self.ticks, game_state, score, len(self.runs)))
+            for mask, length in self.runs:
+                f.write(RUN.pack(mask, length))
+        print(f"Ввод записан: {self.path}, {self.ticks} тиков, {len(self.runs)} серий, "
+              f"состояние {game_state}, счет {score}")
+
+
+class Replay:
+    """Загруженная запись ввода и ожидаемый итог"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, sim_rate, ticks, game_state, score, run_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Неподдерживаемый формат записи: {path}")
+        self.sim_rate = sim_rate
+        self.ticks = ticks
+        self.game_state = game_state
+        self.score = score
+        self.runs = [RUN.unpack_from(data, HEADER.size + i * RUN.size) for i in range(run_count)]
+
+    def matches(self, game):
+        """Пришла ли игра к тому же итогу, что и при записи"""
+        return game.game_state == self.game_state and game.player.score == self.score
+
+
+class ReplayInput:
+    """Ввод из записи для Game.run_headless"""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self._run = 0
+        self._left = 0
+        self._input = None
+        self._decoded = {}
+
+    def next_input(self, game):
+        if not self._left:
+            runs = self.replay.runs
+            if self._run >= len(runs):
+                return frozenset(), frozenset()  # Запись кончилась: клавиши отпущены
+            mask, self._left = runs[self._run]
+            self._run += 1
+            self._input = self._decoded.get(mask)
+            if self._input is None:
+                self._input = self._decoded[mask] = decode_input(mask)
+        self._left -= 1
+        return self._input
@@ -0,0 +1,97 @@
+import pygame
+import random
+import sys
+import os
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.constants import *
+
+
+class ScriptedInput:
+    """Ввод без клавиатуры для Game.run_headless.
+
+    Подклассы задают keys_at(tick, game) - клавиши, зажатые на тике tick.
+    Нажатием считается клавиша, которой не было на прошлом тике."""
+
+    def __init__(self):
+        self.tick = 0
+        self._previous = frozenset()
+
+    def keys_at(self, tick, game):
+        return ()
+
+    def next_input(self, game):
+        """Пара (зажатые, нажатые с прошлого тика) клавиши для следующего тика"""
+        held = frozenset(self.keys_at(self.tick, game))
+        pressed = held - self._previous
+        self._previous = held
+        self.tick += 1
+        return held, pressed
+
+
+class KeyTimeline(ScriptedInput):
+    """Клавиши по расписанию: список (с тика, до тика, клавиша), конец не включается"""
+
+    def __init__(self, spans):
+        super().__init__()
+        self.spans = list(spans)
+
+    def keys_at(self, tick, game):
+        return [key for start, end, key in self.spans if start <= tick < end]
+
+
+class RunnerBot(ScriptedInput):
+    """Бежит вправо, рубит врагов перед собой и прыгает перед краем платформы"""
+
+    def __init__(self, lookahead=30):
+        super().__init__()
+        self.lookahead = lookahead
+
+    def keys_at(self, tick, game):
+        player = game.player
+        keys = [pygame.K_RIGHT]
+        front = player.x + player.width
+        # Атака срабатывает на нажатие, поэтому Q отпускается через тик
+        if pygame.K_q not in self._previous:
+            for enemy in game.enemies:
+                if (enemy.alive and enemy.x + enemy.width > player.x and
+                        enemy.x < front + ATTACK_RANGE and abs(enemy.y - player.y) < PLAYER_HEIGHT):
+                    keys.append(pygame.K_q)
+                    break
+        if player.on_ground and not self._ground_at(game, front + self.lookahead, player.y + player.height):
+            keys.append(pygame.K_SPACE)
+        return keys
+
+    @staticmethod
+    def _ground_at(game, x, feet_y):
+        for platform in game.platforms:
+            if platform.x <= x < platform.x + platform.width and platform.y == feet_y:
+                return True
+        return False
+
+
+class RandomBot(ScriptedInput):
+    """Случайно зажимает и отпускает клавиши (воспроизводимо по seed) -
+    для нагрузочных прогонов"""
+
+    KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_q)
+
+    def __init__(self, seed=0, change_chance=0.05):
+        super().__init__()
+        self.rng = random.Random(seed)
+        self.change_chance = change_chance
+        self.held = {pygame.K_RIGHT}
+
+    def keys_at(self, tick, game):
+        for key in self.KEYS:
+            if self.rng.random() < self.change_chance:
+                self.held ^= {key}
+        return self.held
+
+
+BOTS = {
+    'runner': RunnerBot,
+    'random': RandomBot,
+    'idle': ScriptedInput,
+}
@@ -0,0 +1,46 @@
+class LazyAnimations:
+    """Набор анимаций, кадры которого загружаются при первом обращении.
+
+    loaders - словарь ключ -> функция без аргументов, возвращающая список
+    кадров. Анимации из eager загружаются сразу; остальные - либо при
+    первом animations[key], либо заранее через warm_up().
+    """
+
+    def __init__(self, loaders, eager=()):
+        self._loaders = dict(loaders)
+        self._frames = {}
+        for key in eager:
+            self[key]
+
+    def __getitem__(self, key):
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = self._loaders[key]()
+            self._frames[key] = frames
+        return frames
+
+    def __contains__(self, key):
+        return key in self._loaders
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def keys(self):
+        return self._loaders.keys()
+
+    def pending(self):
+        return [key for key in self._loaders if key not in self._frames]
+
+    def warm_up(self, keys=None, limit=None):
+        """Заранее загружает анимации keys (по умолчанию все оставшиеся).
+        limit ограничивает число анимаций за один вызов, чтобы растянуть
+        загрузку на несколько кадров. Возвращает True, когда загружено все."""
+        pending = self.pending() if keys is None else [key for key in keys if key not in self._frames]
+        if limit is not None:
+            pending = pending[:limit]
+        for key in pending:
+            self[key]
+        return not self.pending() if keys is None else all(key in self._frames for key in keys)
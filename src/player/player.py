@@ -2,27 +2,48 @@ import pygame
 import sys
 import os
 
-# Helper function to get correct resource path
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        # Not running in a PyInstaller bundle
-        # For player.py, the images folder is two levels up from src/player/
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    return os.path.join(base_path, relative_path)
-
 # Add the game root directory to Python path
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
 from src.constants import *
+from src.assets.cache import asset_cache
+from src.assets.atlas import get_atlas
+from src.assets.transforms import transform_cache
+from src.assets.manifest import (PLAYER_ANIMATION_SOURCES, PLAYER_FLIPPED_ANIMATIONS, PLAYER_KEEP_ASPECT_ANIMATIONS,
+                                 PLAYER_EAGER_ANIMATIONS, PLAYER_ATLAS_INDEX)
+from src.player.animations import LazyAnimations
+from src.ui.text_cache import render_text
+
+_atlas_checked = False
+_atlas = None
+
+
+def _player_atlas():
+    """Атлас игрока или None, если его нет или он собран под другой размер.
+    Проверка выполняется один раз за запуск."""
+    global _atlas_checked, _atlas
+    if not _atlas_checked:
+        _atlas_checked = True
+        try:
+            atlas = get_atlas(PLAYER_ATLAS_INDEX)
+            if atlas.frame_size != (PLAYER_WIDTH, PLAYER_HEIGHT):
+                print(f"Атлас собран для размера {atlas.frame_size}, загружаем отдельные файлы")
+            else:
+                _atlas = atlas
+        except Exception as e:
+            print(f"Атлас игрока недоступен, загружаем отдельные файлы: {e}")
+    return _atlas
+
 
 class Player:
     def __init__(self, x, y):
         # Позиция и размеры
         self.x = x
         self.y = y
+        # Положение на прошлом тике и интерполированное для отрисовки
+        self.prev_x = x
+        self.prev_y = y
+        self.render_x = x
+        self.render_y = y
         self.width = PLAYER_WIDTH
         self.height = PLAYER_HEIGHT
         
@@ -46,107 +67,77 @@ class Player:
         self.last_update = pygame.time.get_ticks()
         self.frame_delay = 1000 // ANIMATION_FRAME_SPEED  # Конвертируем кадры в секунду в миллисекунды
         self.animations = self._load_animations()
+        # [поверхность, позиция] игрока и счета для пакетной отрисовки
+        self._sprites = [[None, [0, 0]], [None, (10, 10)]]
+        self._score_value = None
         self.current_image = self.animations['right'][0] if self.animations['right'] else pygame.Surface((PLAYER_WIDTH, PLAYER_HEIGHT))
     
     def _load_animations(self):
-        animations = {
-            'right': [],
-            'left': [],
-            'jump_right': [],
-            'jump_left': [],
-            'attack_right': [],
-            'attack_left': [],
-        }
-        
-        # Загрузка анимаций ходьбы вправо
-        for i in range(1, 9):
-            try:
-                path = resource_path(os.path.join('images', 'player_run', 'player_right', f'player_right{i}.png'))
-                # if os.path.exists(path): # This check is less reliable with _MEIPASS
-                image = pygame.image.load(path)
-                image = pygame.transform.scale(image, (PLAYER_WIDTH, PLAYER_HEIGHT))
-                animations['right'].append(image)
-            except Exception as e:
-                print(f"Ошибка загрузки {path}: {e}")
+        # Бег загружается сразу, остальное (прыжок, атака, смерть) - при первом
+        # обращении или заранее через warm_up_animations()
+        keys = list(PLAYER_ANIMATION_SOURCES) + list(PLAYER_FLIPPED_ANIMATIONS)
+        loaders = {key: (lambda key=key: self._load_frames(key)) for key in keys}
+        return LazyAnimations(loaders, eager=PLAYER_EAGER_ANIMATIONS)
+    
+    def warm_up_animations(self, limit=None):
+        """Предзагрузка отложенных анимаций (например, пока открыто меню).
+        Возвращает True, когда загружены все анимации."""
+        return self.animations.warm_up(limit=limit)
+    
+    def _load_frames(self, key):
+        # Сначала пробуем готовый атлас (tools/pack_atlas.py): один файл вместо 30+
+        frames = self._load_frames_from_atlas(key)
+        if frames is None:
+            frames = self._load_frames_from_files(key)
         
-        # Загрузка анимаций ходьбы влево
-        for i in range(1, 9):
-            try:
-                path = resource_path(os.path.join('images', 'player_run', 'player_left', f'player_left{i}.png'))
-                # if os.path.exists(path):
-                image = pygame.image.load(path)
-                image = pygame.transform.scale(image, (PLAYER_WIDTH, PLAYER_HEIGHT))
-                animations['left'].append(image)
-            except Exception as e:
-                print(f"Ошибка загрузки {path}: {e}")
+        # Создаем изображение по умолчанию
+        if not frames:
+            default_image = pygame.Surface((PLAYER_WIDTH, PLAYER_HEIGHT))
+            default_image.fill(BLUE)
+            frames = [default_image]
+        return frames
+    
+    def _load_frames_from_atlas(self, key):
+        atlas = _player_atlas()
+        if atlas is None or key not in atlas:
+            return None
+        try:
+            return atlas.frames(key)
+        except Exception as e:
+            print(f"Ошибка загрузки анимации {key} из атласа: {e}")
+            return None
+    
+    def _load_frames_from_files(self, key):
+        # Зеркальные анимации получаем отражением исходной
+        if key in PLAYER_FLIPPED_ANIMATIONS:
+            source_frames = self.animations[PLAYER_FLIPPED_ANIMATIONS[key]]
+            return [transform_cache.flip(frame, True, False) for frame in source_frames]
         
-        # Загрузка анимаций прыжка вправо
-        for i in range(1, 5):
+        frames = []
+        for path in PLAYER_ANIMATION_SOURCES[key]:
             try:
-                path = resource_path(os.path.join('images', 'player_jump', 'jumpr', f'Jump{i}r.png'))
-                # if os.path.exists(path):
-                image = pygame.image.load(path)
-                image = pygame.transform.scale(image, (PLAYER_WIDTH, PLAYER_HEIGHT))
-                animations['jump_right'].append(image)
+                if key in PLAYER_KEEP_ASPECT_ANIMATIONS:
+                    # Масштабируем по высоте персонажа, сохраняя пропорции
+                    orig_width, orig_height = asset_cache.native_size(path)
+                    size = (int(orig_width * PLAYER_HEIGHT / orig_height), PLAYER_HEIGHT)
+                else:
+                    size = (PLAYER_WIDTH, PLAYER_HEIGHT)
+                frames.append(asset_cache.get_image(path, size))
             except Exception as e:
                 print(f"Ошибка загрузки {path}: {e}")
-          # Загрузка анимаций прыжка влево
-        for i in range(1, 5):
-            try:
-                path = resource_path(os.path.join('images', 'player_jump', 'jumpl', f'Jump{i}l.png'))
-                # if os.path.exists(path):
-                image = pygame.image.load(path)
-                image = pygame.transform.scale(image, (PLAYER_WIDTH, PLAYER_HEIGHT))
-                animations['jump_left'].append(image)
-            except Exception as e:
-                print(f"Ошибка загрузки {path}: {e}")
-        
-        # Загрузка анимаций атаки
-        attack_files = [
-            'Attack1r.png',
-            'Attack2.png',
-            'Attack3.png',
-            'Attack4.png'
-        ]
-        for i, filename in enumerate(attack_files):
-            try:
-                path = resource_path(os.path.join('images', 'player_Attack', 'Attak', filename))
-                # if os.path.exists(path):
-                # Загружаем исходное изображение
-                original_image = pygame.image.load(path)
-                
-                # Определяем размеры, сохраняя пропорции
-                orig_width, orig_height = original_image.get_size()
-                scale_factor = PLAYER_HEIGHT / orig_height  # Масштабируем по высоте персонажа
-                attack_width = int(orig_width * scale_factor)
-                attack_height = PLAYER_HEIGHT
-                
-                # Масштабируем с сохранением пропорций
-                image = pygame.transform.scale(original_image, (attack_width, attack_height))
-                animations['attack_right'].append(image)
-                
-                # Зеркально отображаем для атаки влево
-                flipped_image = pygame.transform.flip(image, True, False)
-                animations['attack_left'].append(flipped_image)
-                print(f"Успешно загружена анимация атаки: {filename} (размер: {attack_width}x{attack_height})")
-            except Exception as e:
-                print(f"Ошибка загрузки анимации атаки {filename}: {e}")
-        
-        # Создаем изображения по умолчанию
-        for key in animations:
-            if not animations[key]:
-                default_image = pygame.Surface((PLAYER_WIDTH, PLAYER_HEIGHT))
-                default_image.fill(BLUE)
-                animations[key] = [default_image]        
-        return animations
+        return frames
     
     def move(self):
+        """Один тик симуляции"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Применяем гравитацию
-        self.vel_y += self.gravity
+        self.vel_y += self.gravity * SIM_STEP_SCALE
         
         # Обновляем позицию
-        self.x += self.vel_x
-        self.y += self.vel_y
+        self.x += self.vel_x * SIM_STEP_SCALE
+        self.y += self.vel_y * SIM_STEP_SCALE
         
         # Ограничиваем движение по X
         if self.x < 0:
@@ -195,10 +186,21 @@ class Player:
                 if self.animations[animation_key]:
                     self.current_image = self.animations[animation_key][0]
     
+    def interpolate(self, alpha):
+        """Положение для отрисовки между прошлым (alpha=0) и текущим (alpha=1) тиком"""
+        self.render_x = self.prev_x + (self.x - self.prev_x) * alpha
+        self.render_y = self.prev_y + (self.y - self.prev_y) * alpha
+
     def draw(self, screen, camera):
-        # Рисуем игрока с учетом камеры
-        screen_x = self.x - camera.camera.x
-        screen_y = self.y
+        """Рисует игрока и счет, возвращает список затронутых прямоугольников"""
+        return [screen.blit(surface, dest) for surface, dest in self.sprites(camera)]
+
+    def sprites(self, camera):
+        """Пары (поверхность, позиция на экране) игрока и счета
+        для пакетной отрисовки"""
+        # Рисуем игрока с учетом камеры (в интерполированном положении)
+        screen_x = self.render_x - camera.camera.x
+        screen_y = self.render_y
         
         # При атаке учитываем возможное изменение размеров анимации
         if self.is_attacking:
@@ -212,18 +214,27 @@ class Player:
                 attack_x = screen_x - (image_width - self.width)  # Атака влево
             
             # Отрисовка анимации атаки
-            screen.blit(self.current_image, (attack_x, screen_y))
+            sprite_x = attack_x
             
             # Для отладки можно нарисовать рамку
             # pygame.draw.rect(screen, RED, (screen_x, screen_y, self.width, self.height), 1)
         else:
             # Обычная отрисовка
-            screen.blit(self.current_image, (screen_x, screen_y))
+            sprite_x = screen_x
+        
+        # Пары переиспользуются между кадрами и обновляются на месте
+        sprite, score = self._sprites
+        sprite[0] = self.current_image
+        dest = sprite[1]
+        dest[0] = sprite_x
+        dest[1] = screen_y
         
         # Отображаем счет
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f'Score: {self.score}', True, WHITE)
-        screen.blit(score_text, (10, 10))
+        # Счет растеризуется заново только при его изменении
+        if self._score_value != self.score:
+            self._score_value = self.score
+            score[0] = render_text(f'Score: {self.score}', 36, WHITE)
+        return self._sprites
     
     def start_attack(self):
         # Начинаем атаку только если сейчас не атакуем
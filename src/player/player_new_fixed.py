@@ -5,6 +5,8 @@ import os
 # Add the game root directory to Python path
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
 from src.constants import *
+from src.player.animations import LazyAnimations
+from src.assets.transforms import transform_cache
 
 class Player:
     def __init__(self, x, y):
@@ -87,7 +89,25 @@ class Player:
                 print(f"Путь к файлу: {img_path}")
         
         print(f"Загружено {jump_frames_loaded} из 9 кадров прыжка")
-          # Load attack animations
+        
+        # Атака и смерть нужны не в каждой сессии: загружаем их при первом обращении
+        # (или заранее через warm_up_animations)
+        loaded = self.animations
+        self.animations = LazyAnimations({
+            'right': lambda: loaded['right'],
+            'left': lambda: loaded['left'],
+            'jump': lambda: loaded['jump'],
+            'attack_right': self._load_attack_right,
+            'attack_left': self._load_attack_left,
+            'dead': self._load_death_frames,
+        }, eager=('right', 'left', 'jump'))
+            
+        # Current image
+        self.current_image = self.animations['right'][0]
+    
+    def _load_attack_right(self):
+        root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        frames = []
         print("Загрузка анимаций атаки...")
         for i in range(1, 5):
             try:
@@ -95,23 +115,28 @@ class Player:
                 if os.path.exists(img_path):
                     img = pygame.image.load(img_path)
                     img = pygame.transform.scale(img, (PLAYER_WIDTH * 1.5, PLAYER_HEIGHT))
-                    self.animations['attack_right'].append(img)
+                    frames.append(img)
                 else:
                     print(f"Файл не найден: {img_path}")
                     # Create a default attack frame
                     img = pygame.Surface((int(PLAYER_WIDTH * 1.5), PLAYER_HEIGHT))
                     img.fill((255, 0, 0))  # Red rectangle for attack
-                    self.animations['attack_right'].append(img)
+                    frames.append(img)
             except Exception as e:
                 print(f"Ошибка при загрузке кадра атаки {i}: {e}")
                 # Create a default attack frame
                 img = pygame.Surface((int(PLAYER_WIDTH * 1.5), PLAYER_HEIGHT))
                 img.fill((255, 0, 0))  # Red rectangle for attack
-                self.animations['attack_right'].append(img)
-            # Create left attack animation by flipping the right animation
-            flipped_img = pygame.transform.flip(img, True, False)
-            self.animations['attack_left'].append(flipped_img)
-              # Load death animations
+                frames.append(img)
+        return frames
+    
+    def _load_attack_left(self):
+        # Create left attack animation by flipping the right animation
+        return [pygame.transform.flip(img, True, False) for img in self.animations['attack_right']]
+    
+    def _load_death_frames(self):
+        root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        frames = []
         print("Загрузка анимаций смерти...")
         for i in range(1, 7):
             try:
@@ -119,16 +144,18 @@ class Player:
                 if os.path.exists(img_path):
                     img = pygame.image.load(img_path)
                     img = pygame.transform.scale(img, (PLAYER_WIDTH, PLAYER_HEIGHT))
-                    self.animations['dead'].append(img)
+                    frames.append(img)
                 else:
                     print(f"Файл не найден: {img_path}")
-                    self.animations['dead'].append(self.default_image)
+                    frames.append(self.default_image)
             except Exception as e:
                 print(f"Ошибка при загрузке кадра смерти {i}: {e}")
-                self.animations['dead'].append(self.default_image)
-            
-        # Current image
-        self.current_image = self.animations['right'][0]
+                frames.append(self.default_image)
+        return frames
+    
+    def warm_up_animations(self, limit=None):
+        """Предзагрузка отложенных анимаций (например, пока открыто меню)"""
+        return self.animations.warm_up(limit=limit)
     
     def move(self):
         # Apply gravity
@@ -194,7 +221,7 @@ class Player:
             jump_image = self.animations['jump'][frame]
             # Отражаем изображение, если персонаж смотрит влево
             if not self.facing_right:
-                self.current_image = pygame.transform.flip(jump_image, True, False)
+                self.current_image = transform_cache.flip(jump_image, True, False)
             else:
                 self.current_image = jump_image
         else:
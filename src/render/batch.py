@@ -0,0 +1,38 @@
+class SpriteBatch:
+    """Очередь спрайтов мира на кадр.
+
+    Вместо отдельного screen.blit на каждый объект пары (поверхность,
+    позиция) собираются за кадр и уходят на экран одним вызовом
+    Surface.blits. Порядок добавления - порядок отрисовки. Список пар
+    переиспользуется между кадрами.
+    """
+
+    def __init__(self):
+        self._items = []
+
+    def add(self, surface, dest):
+        self._items.append((surface, dest))
+
+    def add_item(self, item):
+        """Добавляет готовую пару (поверхность, позиция); пара может быть
+        списком, который владелец обновляет на месте каждый кадр"""
+        self._items.append(item)
+
+    def add_all(self, items):
+        self._items.extend(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def items(self):
+        return self._items
+
+    def flush(self, screen, doreturn=False):
+        """Рисует накопленные спрайты и очищает очередь. С doreturn=True
+        возвращает список затронутых прямоугольников, иначе пустой список."""
+        if not self._items:
+            return []
+        rects = screen.blits(self._items, doreturn=doreturn)
+        self._items.clear()
+        return rects if doreturn else []
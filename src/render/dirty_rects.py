@@ -0,0 +1,148 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """Вывод кадра только по изменившимся областям экрана.
+
+    Кадр начинается с begin_frame(). Если вид передает статичный слой
+    (фон, платформы при неподвижной камере), области, затронутые в
+    прошлом кадре, восстанавливаются из этого слоя, а на экран уходят
+    через pygame.display.update(rects) только они и области текущего
+    кадра. Когда статичного слоя нет или он сменился (камера сдвинулась,
+    сменился экран), кадр выводится целиком через pygame.display.flip().
+
+    Отмеченные области копируются в прямоугольники из пулов, которые
+    переиспользуются между кадрами, поэтому сам вывод не создает новых Rect.
+    """
+
+    def __init__(self, screen, enabled=True):
+        self.screen = screen
+        self.enabled = enabled
+        self._screen_rect = screen.get_rect()
+        self._screen_area = self._screen_rect.width * self._screen_rect.height
+        self._static_key = None
+        self._previous = []
+        self._current = []
+        self._full = True
+        # Пулов два: области прошлого кадра нужны, пока отмечается текущий
+        self._pools = ([], [])
+        self._pool_index = 0
+        self._merge_pool = []
+        self._merged = []
+
+        # Статистика: доля экрана, перерисованная за кадр
+        self.last_fraction = 1.0
+        self.frames = 0
+        self.full_frames = 0
+        self._fraction_sum = 0.0
+
+    def begin_frame(self, static_layer=None, key=None):
+        """Начинает кадр. static_layer - неподвижная часть экрана, key - ее
+        идентификатор (пока key не меняется, слой считается тем же).
+
+        Возвращает True, если статичный слой уже на экране и вызывающему
+        нужно нарисовать только динамическую часть. False означает полный
+        кадр: рисовать нужно все."""
+        if static_layer is None:
+            self._full = True
+            self._static_key = None
+            return False
+
+        if not self.enabled or key is None or key != self._static_key:
+            self.screen.blit(static_layer, (0, 0))
+            self._full = True
+        else:
+            # Стираем прошлые положения объектов, восстанавливая фон под ними
+            for rect in self._previous:
+                self.screen.blit(static_layer, rect, rect)
+            self._full = False
+        self._static_key = key
+        return True
+
+    def mark(self, rect):
+        """Отмечает область, которую затронул кадр (None игнорируется)"""
+        if rect is None:
+            return
+        self.mark_area(rect[0], rect[1], rect[2], rect[3])
+
+    def mark_all(self, rects):
+        for rect in rects:
+            self.mark(rect)
+
+    def mark_sprites(self, items):
+        """Отмечает области пар (поверхность, позиция), например очереди
+        SpriteBatch до вывода, когда blits не возвращает прямоугольники"""
+        for surface, dest in items:
+            self.mark_area(int(dest[0]), int(dest[1]), surface.get_width(), surface.get_height())
+
+    def mark_area(self, x, y, width, height):
+        """Отмечает область, обрезанную по границам экрана"""
+        right = x + width
+        bottom = y + height
+        if x < 0:
+            x = 0
+        if y < 0:
+            y = 0
+        if right > self._screen_rect.width:
+            right = self._screen_rect.width
+        if bottom > self._screen_rect.height:
+            bottom = self._screen_rect.height
+        if right <= x or bottom <= y:
+            return
+        pool = self._pools[self._pool_index]
+        count = len(self._current)
+        if count == len(pool):
+            pool.append(pygame.Rect(0, 0, 0, 0))
+        rect = pool[count]
+        rect.update(x, y, right - x, bottom - y)
+        self._current.append(rect)
+
+    def present(self):
+        if self._full:
+            pygame.display.flip()
+            fraction = 1.0
+            self.full_frames += 1
+        else:
+            rects = self._merge(self._previous, self._current)
+            pygame.display.update(rects)
+            area = 0
+            for rect in rects:
+                area += rect.width * rect.height
+            fraction = min(1.0, area / self._screen_area)
+
+        self.last_fraction = fraction
+        self._fraction_sum += fraction
+        self.frames += 1
+        # Отметки текущего кадра становятся прошлыми, следующий кадр берет другой пул
+        self._previous, self._current = self._current, self._previous
+        self._current.clear()
+        self._pool_index ^= 1
+
+    def _merge(self, previous, current):
+        """Объединяет пересекающиеся прямоугольники, чтобы одна и та же
+        область не выводилась (и не учитывалась в статистике) дважды"""
+        self._merged.clear()
+        used = self._merge_group(previous, 0)
+        self._merge_group(current, used)
+        return self._merged
+
+    def _merge_group(self, rects, used):
+        merged = self._merged
+        pool = self._merge_pool
+        for source in rects:
+            if used == len(pool):
+                pool.append(pygame.Rect(0, 0, 0, 0))
+            rect = pool[used]
+            used += 1
+            rect.update(source)
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return used
+
+    def report(self):
+        average = self._fraction_sum / self.frames * 100 if self.frames else 0.0
+        print(f"DirtyRectRenderer: {self.frames} frames, {self.full_frames} full, "
+              f"average {average:.1f}% of the screen redrawn per frame")
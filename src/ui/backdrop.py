@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy
+import pygame
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.assets.cache import display_format
+
+# Готовые подложки экранов: (вид, размер, параметры) -> поверхность.
+# Строятся один раз на разрешение и дальше только копируются.
+_surfaces = {}
+
+
+def _gradient_colors(height, top, floor, step):
+    """Цвет каждой строки: канал убывает на 1 каждые step строк, но не ниже floor"""
+    rows = numpy.arange(height)[:, None] // step
+    return numpy.maximum(numpy.array(floor), numpy.array(top) - rows)
+
+
+def gradient(size, top, floor=(0, 0, 0), step=1):
+    """Ступенчатый вертикальный градиент от цвета top вниз до floor.
+
+    Соответствует прежнему рисованию линиями
+    max(floor, top - y // step) для каждой строки y, но строится
+    одним столбцом через surfarray и кэшируется по размеру."""
+    size = (int(size[0]), int(size[1]))
+    key = ('gradient', size, tuple(top), tuple(floor), step)
+    surface = _surfaces.get(key)
+    if surface is None:
+        colors = _gradient_colors(size[1], top, floor, step)
+        # Столбец шириной в пиксель растягивается по ширине без интерполяции
+        column = pygame.surfarray.make_surface(colors[None, :, :].astype(numpy.uint8))
+        surface = pygame.transform.scale(column, size)
+        surface = display_format(surface)
+        _surfaces[key] = surface
+    return surface
+
+
+def overlay(size, color, alpha):
+    """Полупрозрачная заливка цветом color (прозрачность всей поверхности).
+    Для затемнения фона под текстом; одна на размер, цвет и прозрачность."""
+    size = (int(size[0]), int(size[1]))
+    key = ('overlay', size, tuple(color), alpha)
+    surface = _surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        surface = display_format(surface)
+        surface.set_alpha(alpha)
+        _surfaces[key] = surface
+    return surface
@@ -2,6 +2,7 @@ import pygame
 import sys
 sys.path.append('.')
 from src.constants import *
+from src.ui.text_cache import get_font, render_text
 
 class Button:
     def __init__(self, x, y, width, height, text, color):
@@ -9,7 +10,7 @@ class Button:
         self.text = text
         self.color = color
         self.hover_color = self.lighten_color(color, 30)
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
         self.is_hovered = False
         self.pulse_effect = 0
         self.pulse_direction = 1
@@ -43,18 +44,20 @@ class Button:
         pygame.draw.rect(screen, self.lighten_color(current_color, 50), highlight_rect, border_radius=4)
         
         # Увеличиваем размер шрифта, если кнопка активна
-        font_size = 36 + (self.pulse_effect if self.is_hovered else 0)
-        button_font = pygame.font.Font(None, int(font_size))
+        font_size = int(36 + (self.pulse_effect if self.is_hovered else 0))
         
-        # Текст с тенью
-        text_shadow = button_font.render(self.text, True, (30, 30, 30))
-        text_main = button_font.render(self.text, True, WHITE)
+        # Текст с тенью (оба варианта берутся из кэша текста)
+        text_shadow = render_text(self.text, font_size, (30, 30, 30))
+        text_main = render_text(self.text, font_size, WHITE)
         
         shadow_rect = text_shadow.get_rect(center=(self.rect.center[0] + 2, self.rect.center[1] + 2))
         text_rect = text_main.get_rect(center=self.rect.center)
         
         screen.blit(text_shadow, shadow_rect)
         screen.blit(text_main, text_rect)
+        
+        # Область, которую затронула кнопка (для отрисовки грязными прямоугольниками)
+        return self.rect.inflate(6, 6).union(shadow_rect).union(text_rect)
 
     def update(self, mouse_pos):
         prev_hover = self.is_hovered
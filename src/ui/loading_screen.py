@@ -0,0 +1,27 @@
+import pygame
+import sys
+sys.path.append('.')
+from src.constants import *
+from src.ui.text_cache import get_font
+
+
+class LoadingScreen:
+    """Легкий экран загрузки: не использует картинок, только заливку,
+    текст и полосу прогресса, поэтому доступен до загрузки ресурсов."""
+
+    def __init__(self):
+        self.font = get_font(48)
+        self.bar_rect = pygame.Rect(WIDTH//2 - 200, HEIGHT//2 + 20, 400, 20)
+        self.text = self.font.render("Загрузка...", True, WHITE)
+        self.text_rect = self.text.get_rect(center=(WIDTH//2, HEIGHT//2 - 30))
+
+    def draw(self, screen, progress):
+        screen.fill((20, 20, 35))
+        screen.blit(self.text, self.text_rect)
+
+        # Рамка и заполненная часть полосы прогресса
+        pygame.draw.rect(screen, (80, 80, 110), self.bar_rect, 2, border_radius=6)
+        fill_width = int((self.bar_rect.width - 8) * max(0.0, min(1.0, progress)))
+        if fill_width > 0:
+            fill_rect = pygame.Rect(self.bar_rect.x + 4, self.bar_rect.y + 4, fill_width, self.bar_rect.height - 8)
+            pygame.draw.rect(screen, GOLD, fill_rect, border_radius=4)
@@ -1,26 +1,41 @@
 import pygame
 import sys
-import os
 import math
 import random
+import numpy
 sys.path.append('.')
 from src.constants import *
 from src.ui.button import Button
+from src.ui.text_cache import get_font, render_text
+from src.assets.background import get_background
+from src.assets.cache import display_format
+from src.ui import backdrop
+
+# Число уровней яркости звезд: для каждого уровня и размера спрайт рисуется
+# один раз, мерцание выбирает ближайший уровень снизу
+STAR_BRIGHTNESS_LEVELS = 32
+# Цветовой ключ спрайтов звезд (звезды серые, поэтому с ним не совпадают)
+STAR_COLORKEY = (255, 0, 255)
 
 class Menu:
     def __init__(self):
         self.start_button = Button(WIDTH//2 - 100, HEIGHT//2 + 50, 200, 60, "СТАРТ", GREEN)
-        self.title_font = pygame.font.Font(None, 80)
-        self.subtitle_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(80)
+        self.subtitle_font = get_font(36)
         self.animation_timer = 0
         self.stars = self.create_stars(100)
         self.clouds = self.create_clouds(5)
+        self._static_layer = None
+        # Спрайты звезд по размеру: список на все уровни яркости
+        self._star_levels = {star['size']: self.render_star_levels(star['size']) for star in self.stars}
+        # Мерцание считается для всех звезд сразу
+        self._star_speeds = numpy.array([star['speed'] for star in self.stars])
+        self._star_brightness = numpy.array([star['brightness'] for star in self.stars])
+        self._cloud_sprites = {}
         
         # Загружаем фон (если есть)
         try:
-            bg_path = os.path.join('images', 'backgrownd.jpg')
-            self.background = pygame.image.load(bg_path)
-            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+            self.background = get_background((WIDTH, HEIGHT))
             self.has_bg = True
         except:
             self.has_bg = False
@@ -36,6 +51,9 @@ class Menu:
                 'brightness': random.random(),
                 'speed': random.uniform(0.2, 1.0)
             })
+            # Звезды не двигаются: позиция спрайта считается один раз
+            star = stars[-1]
+            star['pos'] = (star['x'] - star['size'], star['y'] - star['size'])
         return stars
     
     def create_clouds(self, count):
@@ -54,9 +72,35 @@ class Menu:
 
     def update_stars(self):
         """Обновляем звезды для эффекта мерцания"""
-        for star in self.stars:
-            star['brightness'] = 0.5 + 0.5 * math.sin(self.animation_timer * star['speed'])
+        brightness = self._star_brightness
+        numpy.multiply(self._star_speeds, self.animation_timer, out=brightness)
+        numpy.sin(brightness, out=brightness)
+        brightness *= 0.5
+        brightness += 0.5
     
+    def render_star_levels(self, size):
+        """Спрайты звезды радиуса size для всех уровней яркости"""
+        sprites = []
+        for level in range(STAR_BRIGHTNESS_LEVELS):
+            color = 255 * level // (STAR_BRIGHTNESS_LEVELS - 1)
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1))
+            sprite.fill(STAR_COLORKEY)
+            pygame.draw.circle(sprite, (color, color, color), (size, size), size)
+            sprite.set_colorkey(STAR_COLORKEY)
+            sprites.append(display_format(sprite))
+        return sprites
+
+    def cloud_sprite(self, width, height, alpha):
+        """Облако (эллипс) заданного размера и прозрачности, рисуется один раз"""
+        key = (width, height, alpha)
+        sprite = self._cloud_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, (255, 255, 255, alpha), (0, 0, width, height))
+            sprite = display_format(sprite, alpha=True)
+            self._cloud_sprites[key] = sprite
+        return sprite
+
     def update_clouds(self):
         """Обновляем положение облаков"""
         for cloud in self.clouds:
@@ -65,38 +109,47 @@ class Menu:
                 cloud['x'] = -cloud['width']
                 cloud['y'] = random.randint(50, HEIGHT//3)
 
+    def static_layer(self):
+        """Неподвижная часть меню (фон с оверлеем или градиент).
+        Собирается один раз, дальше только копируется на экран."""
+        if self._static_layer is None:
+            layer = pygame.Surface((WIDTH, HEIGHT))
+            if self.has_bg:
+                # Если есть изображение фона
+                layer.blit(self.background, (0, 0))
+                # Добавляем полупрозрачный чёрный оверлей для лучшей видимости текста
+                layer.blit(backdrop.overlay((WIDTH, HEIGHT), (0, 0, 0), 150), (0, 0))
+            else:
+                # Градиентный фон: серо-синий сверху, темнеет на 1 каждые 10 строк
+                layer.blit(backdrop.gradient((WIDTH, HEIGHT), (50, 50, 80), (0, 0, 30), step=10), (0, 0))
+            self._static_layer = display_format(layer)
+        return self._static_layer
+
     def draw(self, screen):
+        screen.blit(self.static_layer(), (0, 0))
+        self.draw_dynamic(screen)
+
+    def draw_dynamic(self, screen):
+        """Рисует анимированную часть меню поверх статичного слоя
+        и возвращает список затронутых прямоугольников"""
         # Обновляем анимацию
         self.animation_timer += 0.05
         self.update_stars()
         self.update_clouds()
+        dirty = []
         
-        # Рисуем фон
-        if self.has_bg:
-            # Если есть изображение фона
-            screen.blit(self.background, (0, 0))
-            # Добавляем полупрозрачный чёрный оверлей для лучшей видимости текста
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
-        else:
-            # Градиентный фон
-            for y in range(HEIGHT):
-                color_value = max(0, 50 - y // 10)
-                pygame.draw.line(screen, (color_value, color_value, color_value + 30), (0, y), (WIDTH, y))
-        
-        # Рисуем звезды
-        for star in self.stars:
-            color = int(255 * star['brightness'])
-            pygame.draw.circle(screen, (color, color, color), 
-                              (int(star['x']), int(star['y'])), star['size'])
+        # Рисуем звезды одним пакетом из готовых спрайтов
+        levels = (self._star_brightness * (STAR_BRIGHTNESS_LEVELS - 1)).astype(int).tolist()
+        sprites = self._star_levels
+        dirty.extend(screen.blits([
+            (sprites[star['size']][level], star['pos'])
+            for star, level in zip(self.stars, levels)
+        ]))
         
         # Рисуем облака
         for cloud in self.clouds:
-            cloud_surface = pygame.Surface((cloud['width'], cloud['height']), pygame.SRCALPHA)
-            pygame.draw.ellipse(cloud_surface, (255, 255, 255, cloud['alpha']), 
-                              (0, 0, cloud['width'], cloud['height']))
-            screen.blit(cloud_surface, (int(cloud['x']), int(cloud['y'])))
+            cloud_surface = self.cloud_sprite(cloud['width'], cloud['height'], cloud['alpha'])
+            dirty.append(screen.blit(cloud_surface, (int(cloud['x']), int(cloud['y']))))
         
         # Текст заголовка с эффектом свечения
         glow_size = 3 + math.sin(self.animation_timer) * 2
@@ -104,25 +157,25 @@ class Menu:
             alpha = 100 - offset * 20
             if alpha > 0:
                 glow_color = (255, 215, 0, alpha)  # Золотое свечение
-                glow_font = pygame.font.Font(None, 80 + offset * 2)
-                glow_text = glow_font.render("ПЛАТФОРМЕР", True, glow_color)
+                glow_text = render_text("ПЛАТФОРМЕР", 80 + offset * 2, glow_color)
                 glow_rect = glow_text.get_rect(center=(WIDTH//2, HEIGHT//3))
-                screen.blit(glow_text, glow_rect)
+                dirty.append(screen.blit(glow_text, glow_rect))
         
         # Основной текст заголовка
-        title_text = self.title_font.render("ПЛАТФОРМЕР", True, GOLD)
+        title_text = render_text("ПЛАТФОРМЕР", 80, GOLD)
         title_rect = title_text.get_rect(center=(WIDTH//2, HEIGHT//3))
-        screen.blit(title_text, title_rect)
+        dirty.append(screen.blit(title_text, title_rect))
         
         # Подзаголовок
-        subtitle_text = self.subtitle_font.render("Приключение начинается...", True, WHITE)
+        subtitle_text = render_text("Приключение начинается...", 36, WHITE)
         subtitle_rect = subtitle_text.get_rect(center=(WIDTH//2, HEIGHT//3 + 60))
-        screen.blit(subtitle_text, subtitle_rect)
+        dirty.append(screen.blit(subtitle_text, subtitle_rect))
         
         # Обновляем и отрисовываем кнопку
         mouse_pos = pygame.mouse.get_pos()
         self.start_button.update(mouse_pos)
-        self.start_button.draw(screen)
+        dirty.append(self.start_button.draw(screen))
+        return dirty
 
     def handle_click(self, pos):
         return self.start_button.is_clicked(pos)
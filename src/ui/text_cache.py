@@ -0,0 +1,62 @@
+from collections import OrderedDict
+
+import pygame
+
+# Реестр шрифтов: (имя, размер) -> pygame.font.Font
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Общий объект шрифта для размера size (создается один раз)"""
+    key = (name, int(size))
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, int(size))
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """Кэш отрендеренного текста с вытеснением давно не использованного (LRU).
+
+    Ключ - (текст, размер, цвет, сглаживание, шрифт), поэтому текст
+    растеризуется заново только когда меняется его содержимое или вид.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, size, color, antialias=True, font_name=None):
+        key = (text, int(size), tuple(color), antialias, font_name)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = get_font(size, font_name).render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._entries.clear()
+
+    def report(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0.0
+        print(f"TextCache: {self.hits} hits, {self.misses} misses, "
+              f"{len(self._entries)} entries, {len(_fonts)} fonts, hit rate {hit_rate:.1f}%")
+
+
+# Общий экземпляр для всей игры
+text_cache = TextCache()
+
+
+def render_text(text, size, color, antialias=True, font_name=None):
+    return text_cache.render(text, size, color, antialias, font_name)
@@ -1,29 +1,34 @@
 import pygame
 import sys
-import os
 import math
 import random
 sys.path.append('.')
 from src.constants import *
 from src.ui.button import Button
+from src.ui.text_cache import get_font, render_text
+from src.assets.background import get_background
+from src.assets.cache import display_format
+from src.ui import backdrop
+from src.assets.transforms import transform_cache
+from src.effects.particles import ParticleSystem
 
 class WinScreen:
     def __init__(self):
         self.retry_button = Button(WIDTH//2 - 125, HEIGHT//2 + 100, 250, 60, "ИГРАТЬ СНОВА", GREEN)
-        self.win_font = pygame.font.Font(None, 84)
-        self.score_font = pygame.font.Font(None, 48)
-        self.message_font = pygame.font.Font(None, 36)
+        self.win_font = get_font(84)
+        self.score_font = get_font(48)
+        self.message_font = get_font(36)
+        # Текст заголовка не меняется: рендерим один раз, масштабируем через кэш
+        self.win_text = render_text("ПОБЕДА!", 84, GOLD)
         
         # Параметры для анимации
         self.animation_timer = 0
-        self.particles = []
+        self.particles = ParticleSystem(capacity=32, gravity=0.05)  # Эффект гравитации
         self.create_particles()
         
         # Загружаем фон (если есть)
         try:
-            bg_path = os.path.join('images', 'backgrownd.jpg')
-            self.background = pygame.image.load(bg_path)
-            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+            self.background = get_background((WIDTH, HEIGHT))
             self.has_bg = True
         except:
             self.has_bg = False
@@ -36,66 +41,95 @@ class WinScreen:
                 'angle': angle,
                 'length': random.randint(80, 150)  # Еще меньше длина для минимализма
             })
+        # Поверхность под лучи: квадрат вокруг источника с запасом на пульсацию
+        self.ray_radius = int(max(ray['length'] for ray in self.rays) * 0.4) + 5
+        self.ray_surface = pygame.Surface((self.ray_radius * 2, self.ray_radius * 2), pygame.SRCALPHA)
+        self.ray_origin = (WIDTH // 2 - self.ray_radius, HEIGHT // 3 - 80 - self.ray_radius)
+        
+        self._static_layer = None
+        self._static_score = None
+        self._glow_cache = {}
     
     def create_particles(self):
         """Создаем частицы для эффекта 'фейерверка' победы"""
-        self.particles = []
-        for _ in range(15):  # Совсем мало частиц для минимализма
-            x = random.randint(WIDTH//3, WIDTH*2//3)
-            y = random.randint(HEIGHT//6, HEIGHT//3)
-            dx = random.uniform(-1.0, 1.0)
-            dy = random.uniform(-1.5, 0)
-            color = random.choice([GOLD, (255, 255, 255)])
-            size = random.randint(1, 2)  # Маленький размер для минимализма
-            lifetime = random.randint(20, 50)
-            self.particles.append({
-                'x': x, 'y': y, 
-                'dx': dx, 'dy': dy,
-                'color': color, 'size': size,
-                'lifetime': lifetime
-            })
+        self.particles.clear()
+        self.particles.emit(15,  # Совсем мало частиц для минимализма
+                            (WIDTH//3, WIDTH*2//3), (HEIGHT//6, HEIGHT//3),
+                            vx=(-1.0, 1.0), vy=(-1.5, 0), lifetime=(20, 50),
+                            colors=(GOLD, (255, 255, 255)),
+                            sizes=(1, 2))  # Маленький размер для минимализма
     
     def update_particles(self):
         """Обновляем положение частиц"""
-        new_particles = []
-        for p in self.particles:
-            p['lifetime'] -= 1
-            if p['lifetime'] > 0:
-                # Эффект гравитации
-                p['dy'] += 0.05
-                p['x'] += p['dx']
-                p['y'] += p['dy']
-                new_particles.append(p)
-        self.particles = new_particles
-          # Добавляем новые частицы, если старые исчезли
-        if len(self.particles) < 5 and random.random() < 0.08:
+        self.particles.update()
+        # Добавляем новые частицы, если старые исчезли
+        if self.particles.count < 5 and random.random() < 0.08:
             self.create_particles()
     
-    def draw(self, screen, score):
-        # Обновляем анимацию
-        self.animation_timer += 0.05
-        self.update_particles()
-        
+    def static_layer(self, score):
+        """Неподвижная часть экрана: затемненный фон и тексты счета.
+        Собирается один раз при входе на экран (и заново, только если
+        сменился счет), дальше только копируется на экран."""
+        if self._static_layer is None or self._static_score != score:
+            layer = pygame.Surface((WIDTH, HEIGHT))
+            self.draw_static(layer, score)
+            self._static_layer = display_format(layer)
+            self._static_score = score
+        return self._static_layer
+
+    def draw_static(self, surface, score):
         # Рисуем фон
         if self.has_bg:
             # Если есть изображение фона, делаем его немного темнее для контраста
-            darkened_bg = self.background.copy()
-            dark_overlay = pygame.Surface((WIDTH, HEIGHT))
-            dark_overlay.fill((0, 0, 30))
-            dark_overlay.set_alpha(100)
-            darkened_bg.blit(dark_overlay, (0, 0))
-            screen.blit(darkened_bg, (0, 0))
+            surface.blit(self.background, (0, 0))
+            surface.blit(backdrop.overlay((WIDTH, HEIGHT), (0, 0, 30), 100), (0, 0))
         else:
             # Минималистичный градиент
-            for y in range(HEIGHT):
-                blue_value = max(0, 30 - y // 20)
-                pygame.draw.line(screen, (0, 0, blue_value), (0, y), (WIDTH, y))
+            surface.blit(backdrop.gradient((WIDTH, HEIGHT), (0, 0, 30), step=20), (0, 0))
         
         # Желтые полосы убраны по запросу пользователя
         
-        # Рисуем минималистичные световые лучи (делаем их еще тоньше и прозрачнее)
-        ray_center_x, ray_center_y = WIDTH // 2, HEIGHT // 3 - 80  # Источник лучей еще выше
-        ray_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        # Рисуем информацию о счете
+        score_text = render_text(f"Ваш счет: {score}", 48, WHITE)
+        message_text = render_text("Вы достигли конца уровня!", 36, (200, 200, 200))
+        
+        score_rect = score_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 30))
+        message_rect = message_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 70))
+        
+        surface.blit(score_text, score_rect)
+        surface.blit(message_text, message_rect)
+
+    def glow_surface(self, size):
+        """Рамка свечения вокруг заголовка; заголовок пульсирует в узком
+        диапазоне размеров, поэтому рамки кэшируются по размеру"""
+        glow = self._glow_cache.get(size)
+        if glow is None:
+            width, height = size
+            glow = pygame.Surface((width + 20, height + 20), pygame.SRCALPHA)
+            for i in range(6, 0, -2):  # Еще меньше слоев свечения
+                alpha = 12 - i  # Еще меньше яркость свечения
+                pygame.draw.rect(glow, (255, 215, 0, alpha),
+                              (10-i, 10-i, width + i*2, height + i*2), 1)
+            self._glow_cache[size] = glow
+        return glow
+    
+    def draw(self, screen, score):
+        screen.blit(self.static_layer(score), (0, 0))
+        self.draw_dynamic(screen)
+
+    def draw_dynamic(self, screen):
+        """Рисует анимированную часть (лучи, заголовок, частицы, кнопку)
+        поверх статичного слоя и возвращает список затронутых прямоугольников"""
+        # Обновляем анимацию
+        self.animation_timer += 0.05
+        self.update_particles()
+        dirty = []
+        
+        # Рисуем минималистичные световые лучи (делаем их еще тоньше и прозрачнее).
+        # Лучи рисуются на небольшой переиспользуемой поверхности вокруг источника
+        ray_surface = self.ray_surface
+        ray_surface.fill((0, 0, 0, 0))
+        ray_center_x = ray_center_y = self.ray_radius
         
         for ray in self.rays:
             # Уменьшаем длину и яркость лучей для минимализма
@@ -108,49 +142,34 @@ class WinScreen:
                           (ray_center_x, ray_center_y), 
                           (end_x, end_y), 1)
         
-        screen.blit(ray_surface, (0, 0))
+        dirty.append(screen.blit(ray_surface, self.ray_origin))
         
         # Создаем эффект пульсации для текста
         title_scale = 1.0 + 0.04 * math.sin(self.animation_timer * 0.08)
         
         # Рисуем текст победы (Более крупный и выразительный)
-        win_text = self.win_font.render("ПОБЕДА!", True, GOLD)
+        win_text = self.win_text
         # Масштабируем текст
         scaled_width = int(win_text.get_width() * title_scale)
         scaled_height = int(win_text.get_height() * title_scale)
-        scaled_win_text = pygame.transform.scale(win_text, (scaled_width, scaled_height))
+        scaled_win_text = transform_cache.scale(win_text, (scaled_width, scaled_height))
         
         # Позиционируем текст (перемещаем выше, чтобы не было звездочки)
         win_rect = scaled_win_text.get_rect(center=(WIDTH//2, HEIGHT//3 - 30))
         
         # Рисуем более тонкое свечение вокруг текста победы
-        glow_surface = pygame.Surface((win_rect.width + 20, win_rect.height + 20), pygame.SRCALPHA)
-        for i in range(6, 0, -2):  # Еще меньше слоев свечения
-            alpha = 12 - i  # Еще меньше яркость свечения
-            pygame.draw.rect(glow_surface, (255, 215, 0, alpha),
-                          (10-i, 10-i, win_rect.width + i*2, win_rect.height + i*2), 1)
-        
-        screen.blit(glow_surface, (win_rect.x - 10, win_rect.y - 10))
-        screen.blit(scaled_win_text, win_rect)
-        
-        # Рисуем информацию о счете
-        score_text = self.score_font.render(f"Ваш счет: {score}", True, WHITE)
-        message_text = self.message_font.render("Вы достигли конца уровня!", True, (200, 200, 200))
-        
-        score_rect = score_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 30))
-        message_rect = message_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 70))
-        
-        screen.blit(score_text, score_rect)
-        screen.blit(message_text, message_rect)
+        glow_surface = self.glow_surface(win_rect.size)
+        dirty.append(screen.blit(glow_surface, (win_rect.x - 10, win_rect.y - 10)))
+        dirty.append(screen.blit(scaled_win_text, win_rect))
         
         # Рисуем минималистичные частицы (очень мало для минимализма)
-        for p in self.particles:
-            pygame.draw.circle(screen, p['color'], (int(p['x']), int(p['y'])), p['size'])
+        dirty.extend(self.particles.draw(screen))
         
         # Обновляем и отрисовываем кнопку
         mouse_pos = pygame.mouse.get_pos()
         self.retry_button.update(mouse_pos)
-        self.retry_button.draw(screen)
+        dirty.append(self.retry_button.draw(screen))
+        return dirty
         
     def handle_click(self, pos):
         return self.retry_button.is_clicked(pos)
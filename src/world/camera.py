@@ -11,12 +11,22 @@ class Camera:
         self.camera = pygame.Rect(0, 0, width, height)
         self.width = width
         self.height = height
+        # apply() возвращает один и тот же прямоугольник, чтобы не создавать Rect на объект за кадр
+        self._apply_rect = pygame.Rect(0, 0, 0, 0)
 
     def apply(self, entity):
-        return pygame.Rect(entity.x - self.camera.x, entity.y, entity.width, entity.height)
+        """Прямоугольник объекта на экране. Rect общий для всех вызовов:
+        его нужно использовать сразу и не сохранять"""
+        rect = self._apply_rect
+        rect.update(entity.x - self.camera.x, entity.y, entity.width, entity.height)
+        return rect
 
     def update(self, target):
-        x = -target.x + WIDTH // 2
+        self.follow(target.x)
+
+    def follow(self, target_x):
+        """Центрирует камеру на горизонтальной позиции target_x"""
+        x = -target_x + WIDTH // 2
         x = min(0, x)  # stop scrolling at the left edge
         x = max(-(LEVEL_WIDTH - WIDTH), x)  # stop scrolling at the right edge
         self.camera.x = -x
@@ -0,0 +1,75 @@
+"""Непрерывные (swept AABB) проверки столкновений.
+
+Прямоугольник движется за тик линейно из начального положения в
+конечное, время считается долей тика от 0 до 1. Проверки находят момент
+первого касания, поэтому быстрые объекты и крупный шаг симуляции не
+проскакивают сквозь платформы и врагов между двумя тиками.
+"""
+
+
+def sweep_interval(start, length, other_start, other_length, delta):
+    """Интервал времени (t0, t1), в течение которого отрезок
+    [start, start + length), сдвигающийся за тик на delta, пересекается с
+    неподвижным [other_start, other_start + other_length). Без движения -
+    (-inf, inf) при пересечении и None без него. Границы не включаются."""
+    if delta == 0:
+        if start < other_start + other_length and other_start < start + length:
+            return float('-inf'), float('inf')
+        return None
+    t0 = (other_start - start - length) / delta
+    t1 = (other_start + other_length - start) / delta
+    if t0 > t1:
+        t0, t1 = t1, t0
+    return t0, t1
+
+
+def sweep_aabb(box, dx, dy, other, other_dx=0, other_dy=0):
+    """Время первого касания (0..1) прямоугольников box и other (x, y,
+    width, height), сдвигающихся за тик на (dx, dy) и (other_dx,
+    other_dy); None - если за тик они не пересекаются. Касание только
+    краями пересечением не считается, как и в проверке по кадру."""
+    x_times = sweep_interval(box[0], box[2], other[0], other[2], dx - other_dx)
+    if x_times is None:
+        return None
+    y_times = sweep_interval(box[1], box[3], other[1], other[3], dy - other_dy)
+    if y_times is None:
+        return None
+    enter = max(x_times[0], y_times[0], 0.0)
+    leave = min(x_times[1], y_times[1], 1.0)
+    if enter < leave:
+        return enter
+    return None
+
+
+def landing_time(prev_x, prev_y, x, y, width, height, platform):
+    """Время (0..1), когда падающий прямоугольник встает на платформу,
+    или None.
+
+    Встает - значит верх платформы оказался между его верхом (не включая)
+    и низом (включая) при перекрытии по горизонтали. Проверяется весь путь
+    за тик: момент, когда низ дошел до верха платформы, сравнивается с
+    интервалом перекрытия по горизонтали, поэтому крупный шаг дает ту же
+    посадку, что и несколько мелких. Возвращается момент первого касания."""
+    top = platform.y
+    dy = y - prev_y
+    if dy < 0:
+        return None
+    # По вертикали на платформе, пока top - height <= y(t) < top
+    if dy:
+        v_enter = (top - height - prev_y) / dy
+        v_leave = (top - prev_y) / dy
+    elif prev_y + height >= top and prev_y < top:
+        v_enter, v_leave = float('-inf'), float('inf')
+    else:
+        return None
+    x_times = sweep_interval(prev_x, width, platform.x, platform.width, x - prev_x)
+    if x_times is None:
+        return None
+    enter = max(v_enter, x_times[0], 0.0)
+    if enter < min(v_leave, x_times[1], 1.0):
+        return enter
+    # Касание ровно в конце тика (низ на уровне верха платформы)
+    if (enter == 1.0 and y + height >= top and y < top and
+            x + width > platform.x and x < platform.x + platform.width):
+        return enter
+    return None
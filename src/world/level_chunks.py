@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+import pygame
+import sys
+import os
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.constants import *
+from src.assets.cache import display_format
+
+
+class ChunkedLevelLayer:
+    """Статичная геометрия уровня, заранее отрисованная в горизонтальные чанки.
+
+    Уровень режется на полосы шириной chunk_width (по умолчанию - ширина
+    экрана), каждая полоса рисуется в свою поверхность один раз, при первой
+    необходимости. За кадр выводится не больше двух чанков вместо всех
+    платформ по отдельности. Чанки далеко от камеры вытесняются, их
+    поверхности переиспользуются для новых.
+    """
+
+    def __init__(self, chunk_width=WIDTH, max_chunks=4):
+        self.chunk_width = chunk_width
+        self.max_chunks = max_chunks
+        self._chunks = OrderedDict()  # номер чанка -> поверхность
+        self._free = []               # поверхности вытесненных чанков
+        self._index = None
+        self._top = 0
+        self._height = 0
+        self.chunks_built = 0
+
+    def set_level(self, platform_index, platforms):
+        """Новый уровень: старые чанки сбрасываются и будут собраны заново лениво"""
+        self._index = platform_index
+        # Чанки покрывают по вертикали только полосу, где есть платформы
+        if platforms:
+            top = min(platform.y for platform in platforms)
+            bottom = max(platform.y + platform.height for platform in platforms)
+        else:
+            top = bottom = 0
+        if bottom - top != self._height:
+            self._free = []
+        self._top, self._height = top, bottom - top
+        self._free.extend(self._chunks.values())
+        self._chunks.clear()
+
+    def _build(self, number):
+        if self._free:
+            surface = self._free.pop()
+        else:
+            surface = pygame.Surface((self.chunk_width, max(1, self._height)), pygame.SRCALPHA)
+            surface = display_format(surface, alpha=True)
+        surface.fill((0, 0, 0, 0))
+        x0 = number * self.chunk_width
+        for platform in self._index.query(x0, x0 + self.chunk_width):
+            platform.draw_at(surface, (platform.x - x0, platform.y - self._top))
+        self.chunks_built += 1
+        return surface
+
+    def _chunk(self, number):
+        surface = self._chunks.get(number)
+        if surface is None:
+            surface = self._build(number)
+            self._chunks[number] = surface
+        else:
+            self._chunks.move_to_end(number)
+        return surface
+
+    def draw(self, screen, camera_x, view_width=WIDTH):
+        if self._index is None or self._height <= 0:
+            return
+        first = int(camera_x) // self.chunk_width
+        last = (int(camera_x) + view_width - 1) // self.chunk_width
+        for number in range(first, last + 1):
+            screen.blit(self._chunk(number), (number * self.chunk_width - camera_x, self._top))
+        self._evict(first, last)
+
+    def _evict(self, first, last):
+        # Оставляем соседей видимых чанков, остальное - в пул поверхностей
+        for number in list(self._chunks):
+            if len(self._chunks) <= self.max_chunks:
+                break
+            if number < first - 1 or number > last + 1:
+                self._free.append(self._chunks.pop(number))
+
+    def __len__(self):
+        return len(self._chunks)
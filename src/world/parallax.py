@@ -0,0 +1,54 @@
+import math
+
+import pygame
+import sys
+import os
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.constants import *
+from src.assets.cache import display_format
+
+
+class ParallaxLayer:
+    """Слой параллакса, заранее развернутый в зацикленную полосу.
+
+    Полоса состоит из исходного изображения, повторенного столько раз,
+    чтобы любое окно шириной view_width помещалось в нее целиком. Поэтому
+    кадр стоит ровно один blit с областью-источником и не создает новых
+    объектов: прямоугольник области переиспользуется.
+    """
+
+    def __init__(self, surface, factor, y=0, view_width=WIDTH):
+        self.factor = factor
+        self.period = surface.get_width()
+        repeats = 1 + math.ceil(view_width / self.period)
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+
+        strip = pygame.Surface((self.period * repeats, surface.get_height()), pygame.SRCALPHA if alpha else 0)
+        for i in range(repeats):
+            strip.blit(surface, (i * self.period, 0))
+        self.strip = display_format(strip, alpha)
+
+        self._area = pygame.Rect(0, 0, view_width, surface.get_height())
+        self._dest = (0, y)
+
+    def draw(self, screen, camera_x):
+        self._area.x = int(camera_x * self.factor) % self.period
+        screen.blit(self.strip, self._dest, self._area)
+
+
+class ParallaxBackground:
+    """Набор слоев параллакса, от дальнего к ближнему"""
+
+    def __init__(self, layers=()):
+        self.layers = list(layers)
+
+    def add_layer(self, surface, factor, y=0, view_width=WIDTH):
+        layer = ParallaxLayer(surface, factor, y, view_width)
+        self.layers.append(layer)
+        return layer
+
+    def draw(self, screen, camera_x):
+        for layer in self.layers:
+            layer.draw(screen, camera_x)
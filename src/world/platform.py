@@ -5,6 +5,7 @@ import os
 # Add the game root directory to Python path
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
 from src.constants import *
+from src.world.platform_textures import platform_surface
 
 class Platform:
     def __init__(self, x, y, width):
@@ -14,12 +15,22 @@ class Platform:
         self.height = PLATFORM_HEIGHT
         self.texture = None
 
+    def bounds(self):
+        return self.x, self.x + self.width
+
+    def rect(self):
+        return self.x, self.y, self.width, self.height
+
     def set_texture(self, texture):
-        self.texture = pygame.transform.scale(texture, (self.width, self.height))
+        # Края текстуры сохраняются, середина повторяется; платформы
+        # одного размера делят одну поверхность
+        self.texture = platform_surface(texture, self.width, self.height)
 
     def draw(self, screen, camera):
-        platform_rect = camera.apply(self)
+        self.draw_at(screen, camera.apply(self))
+
+    def draw_at(self, surface, pos):
         if self.texture:
-            screen.blit(self.texture, platform_rect)
+            surface.blit(self.texture, pos)
         else:
-            pygame.draw.rect(screen, GREEN, platform_rect)
+            pygame.draw.rect(surface, GREEN, (pos[0], pos[1], self.width, self.height))
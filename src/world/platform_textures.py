@@ -0,0 +1,82 @@
+import pygame
+import sys
+import os
+
+# Add the game root directory to Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../..'))
+from src.constants import *
+from src.assets.cache import display_format
+from src.assets.transforms import transform_cache
+
+# (id текстуры, ширина, высота, режим) -> (текстура, готовая поверхность).
+# Одинаковые платформы получают одну и ту же поверхность, поэтому память
+# растет с числом разных размеров, а не с числом платформ.
+_surfaces = {}
+
+
+def fit_height(texture, height):
+    """Текстура, приведенная к высоте платформы с сохранением пропорций"""
+    width, tex_height = texture.get_size()
+    if tex_height == height:
+        return texture
+    return transform_cache.scale(texture, (max(1, round(width * height / tex_height)), height))
+
+
+def tile_surface(texture, size):
+    """Заполняет поверхность size повторением текстуры без масштабирования"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    tex_width, tex_height = texture.get_size()
+    for y in range(0, size[1], tex_height):
+        for x in range(0, size[0], tex_width):
+            surface.blit(texture, (x, y))
+    return display_format(surface, alpha=True)
+
+
+def nine_slice_surface(texture, size, border):
+    """Углы и края текстуры остаются как есть, середина и стороны
+    заполняются повторением. border = (слева, сверху, справа, снизу)."""
+    left, top, right, bottom = border
+    tex_width, tex_height = texture.get_size()
+    width, height = size
+    if left + right > width or top + bottom > height:
+        # Платформа уже бортиков: просто сжимаем текстуру целиком
+        return transform_cache.scale(texture, size)
+
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    mid_w = tex_width - left - right
+    mid_h = tex_height - top - bottom
+    columns = [(0, left, 0, left)]  # (x в текстуре, ширина, x на платформе, ширина на платформе)
+    columns.append((left, mid_w, left, width - left - right))
+    columns.append((tex_width - right, right, width - right, right))
+    rows = [(0, top, 0, top)]
+    rows.append((top, mid_h, top, height - top - bottom))
+    rows.append((tex_height - bottom, bottom, height - bottom, bottom))
+
+    for src_y, src_h, dst_y, dst_h in rows:
+        for src_x, src_w, dst_x, dst_w in columns:
+            if src_w <= 0 or src_h <= 0 or dst_w <= 0 or dst_h <= 0:
+                continue
+            piece = texture.subsurface((src_x, src_y, src_w, src_h))
+            if dst_w == src_w and dst_h == src_h:
+                surface.blit(piece, (dst_x, dst_y))
+            else:
+                surface.blit(tile_surface(piece, (dst_w, dst_h)), (dst_x, dst_y))
+    return display_format(surface, alpha=True)
+
+
+def platform_surface(texture, width, height, mode='nine_slice', cap_width=PLATFORM_CAP_WIDTH):
+    """Поверхность платформы нужного размера из текстуры в исходном масштабе.
+    Результат кэшируется по (текстура, ширина, высота, режим)."""
+    key = (id(texture), width, height, mode)
+    entry = _surfaces.get(key)
+    if entry is not None and entry[0] is texture:
+        return entry[1]
+
+    source = fit_height(texture, height)
+    if mode == 'tile':
+        surface = tile_surface(source, (width, height))
+    else:
+        cap = min(cap_width, source.get_width() // 2)
+        surface = nine_slice_surface(source, (width, height), (cap, 0, cap, 0))
+    _surfaces[key] = (texture, surface)
+    return surface
@@ -0,0 +1,138 @@
+from bisect import bisect_left
+
+
+# Объект шире медианы в столько раз хранится в SortedXIndex отдельно
+WIDE_FACTOR = 4
+
+
+class SortedXIndex:
+    """Индекс объектов, отсортированных по левой границе.
+
+    bounds(item) должна возвращать консервативный горизонтальный
+    интервал (left, right), который объект не покидает, пока индекс
+    жив: для платформ это их края, для врагов - зона патрулирования.
+    Запрос диапазона находит кандидатов двоичным поиском, поэтому его
+    стоимость зависит от числа видимых объектов, а не от длины уровня.
+
+    Насколько левее диапазона искать, задает самый широкий объект, так
+    что один очень широкий объект расширил бы окно поиска на весь
+    уровень. Поэтому объекты шире wide_extent (по умолчанию WIDE_FACTOR
+    медиан) лежат в отдельном коротком списке и проверяются перебором.
+    """
+
+    def __init__(self, items, bounds, wide_extent=None):
+        entries = sorted(((*bounds(item), item) for item in items), key=lambda entry: entry[0])
+        if wide_extent is None:
+            extents = sorted(right - left for left, right, _ in entries)
+            wide_extent = extents[len(extents) // 2] * WIDE_FACTOR if extents else 0
+        narrow = []
+        self._wide = []  # (позиция в порядке сортировки, left, right, объект)
+        for position, (left, right, item) in enumerate(entries):
+            if right - left > wide_extent:
+                self._wide.append((position, left, right, item))
+            else:
+                narrow.append((position, left, right, item))
+        self._positions = [entry[0] for entry in narrow]
+        self._lefts = [entry[1] for entry in narrow]
+        self._rights = [entry[2] for entry in narrow]
+        self._items = [entry[3] for entry in narrow]
+        # Самый широкий из обычных объектов ограничивает, насколько левее диапазона искать
+        self._max_extent = max((right - left for _, left, right, _ in narrow), default=0)
+
+    def __len__(self):
+        return len(self._items) + len(self._wide)
+
+    def query(self, x0, x1, out=None):
+        """Объекты, интервал которых пересекает [x0, x1), в порядке левых
+        границ. Если передан список out, результат записывается в него
+        (без нового списка)"""
+        start = bisect_left(self._lefts, x0 - self._max_extent)
+        end = bisect_left(self._lefts, x1)
+        rights = self._rights
+        items = self._items
+        if out is None:
+            out = []
+        else:
+            out.clear()
+        for i in range(start, end):
+            if rights[i] > x0:
+                out.append(items[i])
+        if self._wide:
+            wide = [(position, item) for position, left, right, item in self._wide
+                    if left < x1 and right > x0]
+            if wide:
+                # Широкие объекты встают на свои места среди обычных
+                positions = self._positions
+                merged = [(positions[i], items[i]) for i in range(start, end) if rights[i] > x0]
+                merged.extend(wide)
+                merged.sort(key=lambda entry: entry[0])
+                out[:] = [item for _, item in merged]
+        return out
+
+
+class UniformGrid:
+    """Равномерная сетка (пространственный хэш) неподвижных прямоугольников.
+
+    rect(item) возвращает (x, y, width, height). Сетка строится один раз:
+    каждый объект попадает во все ячейки cell_size x cell_size, которые
+    он задевает. Запрос прямоугольника обходит только его ячейки, так что
+    стоимость зависит от того, сколько объектов рядом, а не от их общего
+    числа. Объекты возвращаются в порядке, в котором были переданы.
+    """
+
+    def __init__(self, items, rect, cell_size=128):
+        self.cell_size = cell_size
+        self._items = list(items)
+        self._cells = {}
+        # Диапазон ячеек объекта: нужен, чтобы отдавать объект только из
+        # одной ячейки запроса, без множества для удаления повторов
+        self._spans = []
+        for index, item in enumerate(self._items):
+            x, y, width, height = rect(item)
+            span = (int(x // cell_size), int(y // cell_size),
+                    int((x + width) // cell_size), int((y + height) // cell_size))
+            self._spans.append(span)
+            for cx in range(span[0], span[2] + 1):
+                for cy in range(span[1], span[3] + 1):
+                    self._cells.setdefault((cx, cy), []).append(index)
+        self._found = []
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def cell_count(self):
+        return len(self._cells)
+
+    def query(self, x, y, width, height, out=None):
+        """Объекты из ячеек, которые задевает прямоугольник (x, y, width,
+        height), границы включительно. Отбор консервативный: точную
+        проверку пересечения делает вызывающий. Если передан список out,
+        результат записывается в него (без нового списка)"""
+        cell_size = self.cell_size
+        qx0 = int(x // cell_size)
+        qy0 = int(y // cell_size)
+        qx1 = int((x + width) // cell_size)
+        qy1 = int((y + height) // cell_size)
+        cells = self._cells
+        spans = self._spans
+        found = self._found
+        found.clear()
+        for cx in range(qx0, qx1 + 1):
+            for cy in range(qy0, qy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    continue
+                for index in cell:
+                    # Объект отдается только из первой общей с запросом ячейки
+                    span = spans[index]
+                    if cx == max(span[0], qx0) and cy == max(span[1], qy0):
+                        found.append(index)
+        found.sort()
+        items = self._items
+        if out is None:
+            return [items[index] for index in found]
+        out.clear()
+        for index in found:
+            out.append(items[index])
+        return out
@@ -0,0 +1,96 @@
+"""Замер накладных расходов на спрайт: отдельные blit против Surface.blits.
+
+Для 100, 1 000 и 10 000 спрайтов сравнивает:
+  - прежнюю схему: новый Rect на спрайт (как раньше создавал
+    Camera.apply) и screen.blit на спрайт;
+  - SpriteBatch с doreturn=False (один screen.blits на кадр);
+  - SpriteBatch с doreturn=True (то же, но с прямоугольниками для
+    вывода грязными областями).
+
+    python tools/bench_blits.py [кадров]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add the game root directory to Python path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+import pygame
+from src.constants import *
+from src.world.camera import Camera
+from src.render.batch import SpriteBatch
+
+SPRITE_COUNTS = (100, 1000, 10000)
+SPRITE_SIZE = 16
+
+
+class BenchSprite:
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.width = SPRITE_SIZE
+        self.height = SPRITE_SIZE
+
+
+def make_texture():
+    texture = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE), pygame.SRCALPHA)
+    pygame.draw.circle(texture, (200, 80, 80, 255), (SPRITE_SIZE // 2, SPRITE_SIZE // 2), SPRITE_SIZE // 2)
+    return texture.convert_alpha()
+
+
+def time_frames(draw, frames, repeats=5):
+    """Лучшее из repeats время кадра, ms: отдельные замеры сильно шумят"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(frames):
+            draw()
+        elapsed = (time.perf_counter() - start) / frames * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(frames=100):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    texture = make_texture()
+    camera = Camera(WIDTH, HEIGHT)
+    camera.camera.x = 100
+    batch = SpriteBatch()
+    rng = random.Random(1)
+
+    print(f"{'спрайтов':>9} {'blit, ms':>10} {'blits, ms':>10} {'+rects, ms':>11} {'экономия, мкс/спрайт':>21}")
+    for count in SPRITE_COUNTS:
+        sprites = [BenchSprite(rng.randint(100, 100 + WIDTH - SPRITE_SIZE), rng.randint(0, HEIGHT - SPRITE_SIZE))
+                   for _ in range(count)]
+
+        def per_sprite():
+            # Camera.apply теперь отдает общий Rect, поэтому прежний путь
+            # с новым Rect на спрайт воспроизводится здесь явно
+            offset = camera.camera.x
+            for sprite in sprites:
+                screen.blit(texture, pygame.Rect(sprite.x - offset, sprite.y, sprite.width, sprite.height))
+
+        def batched(doreturn):
+            offset = camera.camera.x
+            for sprite in sprites:
+                batch.add(texture, (sprite.x - offset, sprite.y))
+            batch.flush(screen, doreturn=doreturn)
+
+        single_ms = time_frames(per_sprite, frames)
+        batch_ms = time_frames(lambda: batched(False), frames)
+        rects_ms = time_frames(lambda: batched(True), frames)
+        saved_us = (single_ms - batch_ms) / count * 1000
+        print(f"{count:>9} {single_ms:>10.3f} {batch_ms:>10.3f} {rects_ms:>11.3f} {saved_us:>21.3f}")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,81 @@
+"""Замер проверки столкновений игрока с платформами.
+
+Для 15, 1 000 и 100 000 платформ сравнивает стоимость тика:
+  - прежнюю схему: проверка AABB со всеми платформами уровня;
+  - UniformGrid: проверка только платформ из ячеек, которые задевает игрок.
+Плотность платформ одинаковая, с ростом их числа удлиняется уровень.
+
+    python tools/bench_collision.py [тиков]
+"""
+import os
+import random
+import sys
+import time
+
+# Add the game root directory to Python path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+from src.constants import *
+from src.world.platform import Platform
+from src.world.spatial import UniformGrid
+
+PLATFORM_COUNTS = (15, 1000, 100000)
+LEVEL_WIDTH_PER_PLATFORM = 210  # Как в основном уровне: 15 платформ на 3200 px
+
+
+def make_level(count, rng):
+    width = count * LEVEL_WIDTH_PER_PLATFORM
+    return [Platform(rng.randrange(0, width), rng.randrange(HEIGHT - 350, HEIGHT - 39, 10),
+                     rng.choice((200, 400, 500, 600)))
+            for _ in range(count)]
+
+
+def touches(platform, x, y):
+    return (y + PLAYER_HEIGHT >= platform.y and y < platform.y and
+            x + PLAYER_WIDTH > platform.x and x < platform.x + platform.width)
+
+
+def time_ticks(positions, check):
+    start = time.perf_counter()
+    hits = 0
+    for x, y in positions:
+        hits += check(x, y)
+    return (time.perf_counter() - start) / len(positions) * 1e6, hits
+
+
+def main(ticks=20000):
+    rng = random.Random(1)
+    print(f"{'платформ':>9} {'ячеек':>7} {'сборка, ms':>11} {'все, мкс/тик':>13} "
+          f"{'сетка, мкс/тик':>15} {'кандидатов':>11}")
+    for count in PLATFORM_COUNTS:
+        platforms = make_level(count, rng)
+        start = time.perf_counter()
+        grid = UniformGrid(platforms, Platform.rect, PLATFORM_GRID_CELL)
+        build_ms = (time.perf_counter() - start) * 1000
+        width = count * LEVEL_WIDTH_PER_PLATFORM
+        positions = [(rng.uniform(0, width), rng.uniform(HEIGHT - 450, HEIGHT - PLAYER_HEIGHT))
+                     for _ in range(ticks)]
+        nearby = []
+
+        def linear(x, y):
+            return sum(1 for platform in platforms if touches(platform, x, y))
+
+        def gridded(x, y):
+            grid.query(x, y, PLAYER_WIDTH, PLAYER_HEIGHT, nearby)
+            return sum(1 for platform in nearby if touches(platform, x, y))
+
+        # Полный перебор на больших уровнях медленный: хватает меньшего числа тиков
+        linear_positions = positions[:max(50, ticks * 15 // count)]
+        linear_us, linear_hits = time_ticks(linear_positions, linear)
+        grid_us, _ = time_ticks(positions, gridded)
+        _, grid_hits = time_ticks(linear_positions, gridded)
+        assert grid_hits == linear_hits, (grid_hits, linear_hits)
+        candidates = sum(len(grid.query(x, y, PLAYER_WIDTH, PLAYER_HEIGHT)) for x, y in positions) / ticks
+        print(f"{count:>9} {grid.cell_count:>7} {build_ms:>11.1f} {linear_us:>13.2f} "
+              f"{grid_us:>15.2f} {candidates:>11.2f}")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*args)
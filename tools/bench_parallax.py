@@ -0,0 +1,66 @@
+"""Замер стоимости слоев параллакса.
+
+Сравнивает старую схему (два blit полного фона за кадр) с
+ParallaxLayer для 1..N слоев и печатает время кадра и время на слой.
+
+    python tools/bench_parallax.py [кадров] [макс. слоев]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add the game root directory to Python path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+import pygame
+from src.constants import *
+from src.world.parallax import ParallaxBackground
+
+
+def make_layer_source(index, alpha):
+    """Синтетический слой: непрозрачный дальний фон или полупрозрачная полоса"""
+    if not alpha:
+        surface = pygame.Surface((WIDTH, HEIGHT))
+        surface.fill((40 + index * 10, 40, 60))
+        return surface.convert()
+    surface = pygame.Surface((WIDTH, HEIGHT // 3), pygame.SRCALPHA)
+    surface.fill((20, 20 + index * 20, 40, 160))
+    return surface.convert_alpha()
+
+
+def time_frames(draw, frames):
+    start = time.perf_counter()
+    for frame in range(frames):
+        draw(frame * 3)  # камера сдвигается на 3 пикселя за кадр
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main(frames=2000, max_layers=4):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    background = make_layer_source(0, alpha=False)
+
+    def old_draw(camera_x):
+        rel_x = camera_x % WIDTH
+        screen.blit(background, (-rel_x, 0))
+        if rel_x < WIDTH:
+            screen.blit(background, (WIDTH - rel_x, 0))
+
+    old_ms = time_frames(old_draw, frames)
+    print(f"старая схема (2 blit полного фона): {old_ms:.3f} ms/кадр")
+
+    for count in range(1, max_layers + 1):
+        parallax = ParallaxBackground()
+        parallax.add_layer(background, 0.2)
+        for i in range(1, count):
+            parallax.add_layer(make_layer_source(i, alpha=True), 0.2 + 0.2 * i, HEIGHT - HEIGHT // 3)
+        ms = time_frames(lambda camera_x: parallax.draw(screen, camera_x), frames)
+        print(f"{count} слой(ев): {ms:.3f} ms/кадр, {ms / count:.3f} ms/слой")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,84 @@
+"""Сборка бандла ресурсов assets.bundle.
+
+Все изображения из src/assets/manifest.bundle_images() записываются
+уже масштабированными, в виде сырых пикселей BGRA, плюс JSON-индекс.
+Игра отображает файл в память и не декодирует JPEG/PNG при запуске.
+Вызывается из main.spec перед сборкой PyInstaller, либо вручную:
+
+    python tools/build_bundle.py
+"""
+import json
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add the game root directory to Python path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+import pygame
+from src.assets.cache import AssetCache
+from src.assets.bundle import MAGIC, VERSION, HEADER, BLOB_ALIGN, PIXEL_FORMAT, BUNDLE_PATH
+from src.assets.manifest import bundle_images, BACKGROUND_IMAGE
+from src.assets.background import background_service
+
+
+def _align(offset):
+    return (offset + BLOB_ALIGN - 1) // BLOB_ALIGN * BLOB_ALIGN
+
+
+def build_bundle(out_path=os.path.join(ROOT_DIR, BUNDLE_PATH)):
+    pygame.init()
+    # Отдельный кэш без бандла: всегда читаем исходные файлы
+    cache = AssetCache()
+
+    blobs = []
+    entries = []
+    for path, size, alpha in bundle_images():
+        if path == BACKGROUND_IMAGE:
+            # Фон собирается так же, как в игре без бандла: из мип-уровней
+            surface = cache.register(path, background_service.prepare(size), size, alpha)
+        else:
+            surface = cache.get_image(path, size, alpha)
+        data = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        width, height = surface.get_size()
+        entries.append({
+            'path': path.replace(os.sep, '/'),
+            'size': list(size) if size is not None else None,
+            'alpha': alpha,
+            'native_size': list(cache.native_size(path)),
+            'width': width,
+            'height': height,
+            'format': PIXEL_FORMAT,
+            'length': len(data),
+        })
+        blobs.append(data)
+
+    # Смещения зависят от длины индекса, а индекс содержит смещения:
+    # считаем с запасом, пока длина не перестанет меняться
+    index_length = 0
+    while True:
+        offset = _align(HEADER.size + index_length)
+        for entry in entries:
+            entry['offset'] = offset
+            offset = _align(offset + entry['length'])
+        index = json.dumps({'entries': entries}).encode('utf-8')
+        if len(index) == index_length:
+            break
+        index_length = len(index)
+
+    with open(out_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for entry, data in zip(entries, blobs):
+            f.seek(entry['offset'])
+            f.write(data)
+
+    total = sum(entry['length'] for entry in entries)
+    print(f"Бандл {out_path}: {len(entries)} изображений, {total / 1024:.1f} KB пикселей")
+    return out_path
+
+
+if __name__ == '__main__':
+    build_bundle()
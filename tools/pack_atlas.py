@@ -0,0 +1,110 @@
+"""Офлайн-упаковщик атласа анимаций игрока.
+
+Собирает кадры из images/player_* в листы images/atlas/*.png (разбиение
+на листы задает PLAYER_ATLAS_SHEETS) и пишет индекс прямоугольников
+кадров в images/atlas/player.json.
+Кадры сохраняются уже масштабированными под PLAYER_WIDTH x PLAYER_HEIGHT,
+поэтому после изменения этих констант атлас нужно пересобрать:
+
+    python tools/pack_atlas.py
+"""
+import json
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add the game root directory to Python path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+import pygame
+from src.constants import *
+from src.assets.cache import asset_cache
+from src.assets.manifest import (PLAYER_ANIMATION_SOURCES, PLAYER_FLIPPED_ANIMATIONS,
+                                 PLAYER_KEEP_ASPECT_ANIMATIONS, PLAYER_ATLAS_INDEX, PLAYER_ATLAS_SHEETS)
+
+MAX_SHEET_WIDTH = 1024
+PADDING = 1
+
+
+def load_frames():
+    """Загружаем и масштабируем кадры так же, как это делает Player"""
+    animations = {}
+    for key, paths in PLAYER_ANIMATION_SOURCES.items():
+        frames = []
+        for path in paths:
+            if key in PLAYER_KEEP_ASPECT_ANIMATIONS:
+                orig_width, orig_height = asset_cache.native_size(path)
+                size = (int(orig_width * PLAYER_HEIGHT / orig_height), PLAYER_HEIGHT)
+            else:
+                size = (PLAYER_WIDTH, PLAYER_HEIGHT)
+            frames.append(asset_cache.get_image(path, size))
+        animations[key] = frames
+
+    for key, source_key in PLAYER_FLIPPED_ANIMATIONS.items():
+        animations[key] = [pygame.transform.flip(frame, True, False) for frame in animations[source_key]]
+    return animations
+
+
+def pack(animations, max_width=MAX_SHEET_WIDTH, padding=PADDING):
+    """Простая упаковка полками: кадры идут слева направо, при переполнении
+    ширины начинается новая полка. Возвращает размер листа и прямоугольники."""
+    rects = {}
+    x = y = 0
+    shelf_height = 0
+    sheet_width = 0
+    for key, frames in animations.items():
+        rects[key] = []
+        for frame in frames:
+            width, height = frame.get_size()
+            if x + width > max_width:
+                x = 0
+                y += shelf_height + padding
+                shelf_height = 0
+            rects[key].append([x, y, width, height])
+            x += width + padding
+            shelf_height = max(shelf_height, height)
+            sheet_width = max(sheet_width, x)
+    return (sheet_width, y + shelf_height), rects
+
+
+def format_index(index):
+    """JSON с одной анимацией на строку, чтобы индекс было удобно сравнивать в git"""
+    lines = ['{', f'  "frame_size": {json.dumps(index["frame_size"])},', '  "animations": {']
+    items = list(index['animations'].items())
+    for i, (key, animation) in enumerate(items):
+        comma = ',' if i < len(items) - 1 else ''
+        lines.append(f'    {json.dumps(key)}: {json.dumps(animation)}{comma}')
+    lines += ['  }', '}', '']
+    return '\n'.join(lines)
+
+
+def build_atlas(index_path=PLAYER_ATLAS_INDEX, sheets=PLAYER_ATLAS_SHEETS):
+    pygame.init()
+    animations = load_frames()
+    out_dir = os.path.join(ROOT_DIR, os.path.dirname(index_path))
+    os.makedirs(out_dir, exist_ok=True)
+
+    index = {'frame_size': [PLAYER_WIDTH, PLAYER_HEIGHT], 'animations': {}}
+    for sheet_name, keys in sheets.items():
+        sheet_animations = {key: animations[key] for key in keys}
+        size, rects = pack(sheet_animations)
+
+        sheet = pygame.Surface(size, pygame.SRCALPHA)
+        sheet.fill((0, 0, 0, 0))
+        for key, frames in sheet_animations.items():
+            for frame, rect in zip(frames, rects[key]):
+                sheet.blit(frame, rect[:2])
+            index['animations'][key] = {'sheet': sheet_name, 'frames': rects[key]}
+        pygame.image.save(sheet, os.path.join(out_dir, sheet_name))
+
+        frame_count = sum(len(frames) for frames in sheet_animations.values())
+        print(f"Атлас {sheet_name}: {frame_count} кадров, лист {size[0]}x{size[1]}")
+
+    with open(os.path.join(ROOT_DIR, index_path), 'w', encoding='utf-8') as f:
+        f.write(format_index(index))
+
+
+if __name__ == '__main__':
+    build_atlas()
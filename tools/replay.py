@@ -0,0 +1,56 @@
+"""Воспроизведение записи ввода без окна и на максимальной скорости.
+
+Запись делается обычной игрой или прогоном бота с переменной окружения
+REPLAY_RECORD=путь. Воспроизведение идет через Game.run_headless и
+проверяет, что игра пришла к тому же состоянию и счету, что и при
+записи; при расхождении код выхода 1. С числом повторов запись
+проигрывается несколько раз подряд - воспроизводимый замер тиков/с:
+
+    python tools/replay.py запись.replay [повторов]
+"""
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.pop('REPLAY_RECORD', None)  # Воспроизведение не перезаписывает файлы
+
+# Add the game root directory to Python path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+import pygame
+from src.constants import *
+from src.input.replay import Replay, ReplayInput
+from main import Game
+
+
+def main(path, repeat=1):
+    replay = Replay(path)
+    print(f"Запись {path}: {replay.ticks} тиков, {len(replay.runs)} серий, "
+          f"ожидается состояние {replay.game_state}, счет {replay.score}")
+    if replay.sim_rate != SIM_RATE:
+        print(f"Запись сделана при SIM_RATE = {replay.sim_rate}, сейчас {SIM_RATE}")
+        return False
+    game = Game()
+    ok = True
+    try:
+        for attempt in range(repeat):
+            if attempt:
+                game.reset_game()
+            game.run_headless(ReplayInput(replay), replay.ticks)
+            if not replay.matches(game):
+                print(f"Расхождение: состояние {game.game_state}, счет {game.player.score}")
+                ok = False
+    finally:
+        pygame.quit()
+    print("Воспроизведение совпало с записью" if ok else "Воспроизведение НЕ совпало с записью")
+    return ok
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(0 if main(args[0], int(args[1]) if len(args) > 1 else 1) else 1)
@@ -0,0 +1,41 @@
+"""Прогон игры без окна и отрисовки быстрее реального времени.
+
+Использует пустой видеодрайвер SDL, тики Game.update идут без
+ограничения частоты, ввод дает бот из src/input/scripted.py. В конце
+печатается число тиков в секунду. Для CI, ботов и нагрузочных прогонов:
+
+    python tools/run_headless.py [тиков] [runner|random|idle] [restart]
+
+С restart после проигрыша или победы уровень начинается заново,
+пока не будет выполнено заданное число тиков. Частоту симуляции можно
+понизить переменной окружения, например SIM_RATE=15.
+"""
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the game root directory to Python path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+import pygame
+from src.input.scripted import BOTS
+from main import Game
+
+
+def main(ticks=3600, bot='runner', restart=False):
+    game = Game()
+    try:
+        game.run_headless(BOTS[bot](), ticks, restart=restart)
+    finally:
+        pygame.quit()
+    return game
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 3600,
+         args[1] if len(args) > 1 else 'runner',
+         len(args) > 2 and args[2] == 'restart')